@@ -1,19 +1,37 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import codecs
+import functools
+import hashlib
+import inspect
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import selectors
 import shutil
+import stat
 import subprocess
 import sys
-import textwrap
+import tempfile
+import threading
 import time
-import uuid
+import tomllib
+import traceback
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, List, Literal, Optional
 
-import psutil
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from dotenv import dotenv_values
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
@@ -26,38 +44,59 @@ from .smart_async import (
     cancel_job,
     create_progress_callback,
     get_job_status,
+    get_jobs_status,
     initialize_state,
     list_jobs,
     prune_jobs,
     smart_async,
 )
 
-# Configure logging (file + stderr console)
+# Configure logging (file + stderr console). Callers only enqueue records; a
+# listener thread does the file and console writes off the request path.
 LOG_PATH = Path(__file__).resolve().parent / "python_mcp_server.log"
+_LOG_QUEUE: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)s %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_PATH, encoding="utf-8"),
-        logging.StreamHandler(sys.stderr),
-    ],
+    handlers=[logging.handlers.QueueHandler(_LOG_QUEUE)],
+)
+_LOG_LISTENER = logging.handlers.QueueListener(
+    _LOG_QUEUE,
+    logging.FileHandler(LOG_PATH, encoding="utf-8"),
+    logging.StreamHandler(sys.stderr),
 )
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)  # Drains queued records on shutdown
 logger = logging.getLogger("python_mcp_server")
 logger.info("Logger initialized; log file at %s", LOG_PATH)
 
 mcp = FastMCP(name="Python Script Executor")
 
 
+# Section markers of the job-stream:// resource text
+_STREAM_HDR = "---STDOUT---\n"
+_STREAM_MID = "\n---STDERR---\n"
+
+
 # Simple in-memory job registry
-@dataclass
+@dataclass(slots=True)
 class JobRecord:
     job_id: str
     command: list[str]
-    start_time: float
+    start_time: float  # Wall clock, for display only
     process: subprocess.Popen
     directory: Path
-    stdout_chunks: list[str] = field(default_factory=list)
-    stderr_chunks: list[str] = field(default_factory=list)
+    stdout_buf: bytearray = field(default_factory=bytearray)
+    stderr_buf: bytearray = field(default_factory=bytearray)
+    stdout_len: int = 0  # Total bytes received, maintained by _nonblocking_capture
+    stderr_len: int = 0
+    stdout_dropped: int = 0  # Oldest bytes discarded to stay under MAX_CAPTURE_BYTES
+    stderr_dropped: int = 0
+    # Decoded output keyed by the byte counter it was decoded at (see _job_output_text)
+    stdout_text: tuple[int, str] = (0, "")
+    stderr_text: tuple[int, str] = (0, "")
+    # job-stream:// text keyed by (stdout_len, stderr_len) (see get_job_output_stream)
+    stream_text: tuple[int, int, str] = (0, 0, _STREAM_HDR + _STREAM_MID)
     finished: bool = False
     exit_code: Optional[int] = None
     benchmark: dict[str, float] | None = None
@@ -67,16 +106,20 @@ class JobRecord:
     is_inline_temp: bool = (
         False  # Mark if script_path points to a temp inline file for cleanup
     )
+    cached_status: dict[str, str] | None = None  # Listing entry frozen at finalization
+    start_monotonic: float = field(default_factory=time.monotonic)  # For elapsed math
 
 
 # ---------------------------
 # Pydantic output models
 # ---------------------------
+# Results are assembled from values this module produced itself, so call sites use
+# model_construct() to skip re-validating potentially multi-MB stdout/stderr strings.
 class RunScriptResult(BaseModel):
     stdout: str = Field(description="Full captured stdout.")
     stderr: str = Field(description="Full captured stderr.")
     exit_code: int = Field(description="Process exit code.")
-    execution_strategy: Literal["uv-run", "system-python"] = Field(
+    execution_strategy: Literal["uv-run", "system-python", "cached-env"] = Field(
         description="Interpreter strategy chosen."
     )
     elapsed_seconds: float = Field(description="Wall time in seconds.")
@@ -121,7 +164,90 @@ class AsyncDepsJobStart(BaseModel):
 
 
 JOBS: dict[str, JobRecord] = {}
-STREAM_POLL_INTERVAL = 0.2  # seconds
+# Guards JOBS mutation and job finalization. fastmcp calls sync tools on the event
+# loop thread and no worker thread touches JOBS, so the lock is uncontended today;
+# it keeps finalization atomic if that changes. Plain lookups stay lock-free.
+_JOBS_LOCK = threading.RLock()
+MAX_CAPTURE_BYTES = 8 * 1024 * 1024  # per stream; older output is dropped beyond this
+# py_kill_job waits this long after SIGTERM before SIGKILL; it runs on the event
+# loop thread, so keep it short (the baseline slept a fixed 50 ms)
+KILL_GRACE_SECONDS = 0.05
+# Script runs allowed at once (foreground and background); further runs are rejected
+# instead of queueing, so a burst of calls cannot fork-bomb the host.
+MAX_CONCURRENT_RUNS = int(
+    os.environ.get("PYTHON_MCP_MAX_CONCURRENCY") or 2 * (os.cpu_count() or 2)
+)
+_active_runs = 0
+_RUN_SLOTS_LOCK = threading.Lock()
+
+# Inline scripts are read once by the child and then discarded; keep them on tmpfs
+# where available so they never reach the block layer. The directory is private to
+# this process (mkdtemp: fresh name, mode 0o700), so other users cannot plant or
+# swap the scripts it runs.
+INLINE_TMP_DIR = tempfile.mkdtemp(
+    prefix="mcp-inline-",
+    dir="/dev/shm" if sys.platform == "linux" and os.path.isdir("/dev/shm") else None,
+)
+atexit.register(shutil.rmtree, INLINE_TMP_DIR, ignore_errors=True)
+# Released inline script files are kept (LIFO) and overwritten by the next inline run
+# instead of being unlinked and recreated.
+INLINE_POOL_SIZE = 16
+_INLINE_POOL: list[Path] = []
+_INLINE_POOL_LOCK = threading.Lock()
+
+# Resolved once at import so launches skip execvp's PATH walk; falls back to the bare
+# name (resolved per launch) if uv is not on PATH yet.
+_UV_PATH = shutil.which("uv")
+_UV = _UV_PATH or "uv"
+# Prefixes of environment variables worth logging at startup
+_ENV_PREFIXES = ("PYTHON", "UV", "FASTMCP")
+
+
+@contextmanager
+def _run_slot() -> Iterator[None]:
+    """
+    Hold one of MAX_CONCURRENT_RUNS run slots for the duration of the block.
+
+    Never blocks, so it is safe both on the event loop and in worker threads.
+
+    Raises:
+        RuntimeError: If all slots are taken
+    """
+    global _active_runs
+    with _RUN_SLOTS_LOCK:
+        if _active_runs >= MAX_CONCURRENT_RUNS:
+            raise RuntimeError(
+                f"Too many concurrent runs ({MAX_CONCURRENT_RUNS}); retry when a job "
+                "finishes or raise PYTHON_MCP_MAX_CONCURRENCY"
+            )
+        _active_runs += 1
+    try:
+        yield
+    finally:
+        with _RUN_SLOTS_LOCK:
+            _active_runs -= 1
+
+
+def _limit_concurrency(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Run a sync or async script runner inside _run_slot(). Applied below @smart_async,
+    so a run moved to the background keeps its slot until it actually finishes.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def _async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _run_slot():
+                return await func(*args, **kwargs)
+
+        return _async_wrapper
+
+    @functools.wraps(func)
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        with _run_slot():
+            return func(*args, **kwargs)
+
+    return _wrapper
 
 
 def _ensure_python_version(version: str) -> bool:
@@ -137,10 +263,11 @@ def _ensure_python_version(version: str) -> bool:
     try:
         # Check if version is already available
         result = subprocess.run(
-            ["uv", "python", "list"],
+            [_UV, "python", "list"],
             capture_output=True,
             text=True,
             timeout=10,
+            check=False,
         )
         if result.returncode == 0 and version in result.stdout:
             logger.info(f"Python {version} already available")
@@ -149,10 +276,11 @@ def _ensure_python_version(version: str) -> bool:
         # Install the version
         logger.info(f"Installing Python {version} via uv...")
         result = subprocess.run(
-            ["uv", "python", "install", version],
+            [_UV, "python", "install", version],
             capture_output=True,
             text=True,
             timeout=300,
+            check=False,
         )
         if result.returncode == 0:
             logger.info(f"Successfully installed Python {version}")
@@ -165,36 +293,253 @@ def _ensure_python_version(version: str) -> bool:
         return False
 
 
-def _parse_imports(source_text: str) -> list[str]:
+# Interpreter paths resolved via 'uv python find', keyed by requested version.
+_INTERP_PATH_CACHE: dict[str, str] = {}
+
+
+def _find_interpreter(version: str) -> str | None:
     """
-    Parse import statements from Python source and return top-level package names.
+    Resolve (and cache) the interpreter path uv would use for the given version.
 
-    Args:
-        source_text: Python source code
+    Only used for isolated runs without dependencies, where 'uv run' would just
+    fork once more to exec this same interpreter.
 
     Returns:
-        List of top-level package names (excluding stdlib)
+        Absolute interpreter path, or None if uv could not find one.
     """
-    import re
+    cached = _INTERP_PATH_CACHE.get(version)
+    if cached is not None:
+        return cached
+    try:
+        result = subprocess.run(
+            [_UV, "python", "find", "--system", "--no-project", version],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=False,
+        )
+    except Exception as e:
+        logger.warning(f"Error finding Python {version}: {e}")
+        return None
+    interp = result.stdout.strip() if result.returncode == 0 else ""
+    if not interp:
+        return None
+    _INTERP_PATH_CACHE[version] = interp
+    return interp
 
-    lines = source_text.splitlines()
-    detected: set[str] = set()
-    import_pattern = re.compile(r"^(?:from|import)\s+([a-zA-Z0-9_\.]+)")
 
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        m = import_pattern.match(line)
-        if not m:
+# Persistent venvs for dependency runs, keyed by hash(python_version + sorted deps)
+ENV_CACHE_DIR = Path(
+    os.environ.get("PYTHON_MCP_ENV_CACHE_DIR")
+    or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+        "python-mcp",
+        "envs",
+    )
+)
+ENV_CACHE_MAX_ENTRIES = 32  # least recently used venvs beyond this are deleted
+ENV_READY_MARKER = ".python_mcp_ready"  # written once the dependency install succeeded
+ENV_BUILD_TIMEOUT_SECONDS = 600  # per 'uv venv' / 'uv pip install' step
+ENV_BUILD_RETRY_SECONDS = 300  # a failed build is not retried for this long
+_ENV_CACHE: dict[str, Path] = {}  # key -> venv interpreter, for venvs seen ready
+_ENV_CACHE_FAILED: dict[str, float] = {}  # key -> time.monotonic() of its failed build
+_ENV_CACHE_LOCK = threading.Lock()  # guards the two above; builds run outside it
+
+
+def _env_cache_key(python_version: str, dependencies: list[str]) -> str:
+    material = python_version + "\0" + "\0".join(sorted(dependencies))
+    return hashlib.blake2b(material.encode(), digest_size=16).hexdigest()
+
+
+def _venv_python(env_dir: Path) -> Path:
+    return env_dir / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+
+
+@contextmanager
+def _env_build_lock(key: str) -> Iterator[None]:
+    """
+    Serialize builds of one cached env across threads and server processes with an
+    flock on '<key>.lock' in ENV_CACHE_DIR (each open() gets its own lock, so
+    threads of this process wait on each other too). Without fcntl (Windows) builds
+    are not serialized.
+
+    _prune_env_cache unlinks the lock file of an evicted env while holding it, so a
+    lock taken on a file that is no longer at its path is dropped and retaken.
+    """
+    ENV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    lock_path = ENV_CACHE_DIR / f"{key}.lock"
+    while True:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is None:
+            break
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.stat(lock_path).st_ino == os.fstat(fd).st_ino:
+                break
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+    try:
+        yield
+    finally:
+        os.close(fd)  # Also releases the flock
+
+
+def _build_dep_env(
+    key: str,
+    env_dir: Path,
+    python_version: str,
+    dependencies: list[str],
+    deadline: float | None = None,
+) -> bool:
+    """
+    Create the venv in env_dir, install the dependencies and write ENV_READY_MARKER.
+    A failed or timed out build is removed and False returned. Each step gets
+    ENV_BUILD_TIMEOUT_SECONDS, cut short at deadline (a time.monotonic() value).
+
+    Dependencies are resolved once, at build time: an unpinned specifier such as
+    'requests' keeps the version installed then for as long as the venv stays
+    cached. Pin versions, or delete the venv from ENV_CACHE_DIR, to pick up newer
+    releases.
+    """
+    interp = _venv_python(env_dir)
+    env_dir.mkdir(parents=True, exist_ok=True)
+    for cmd in (
+        [_UV, "venv", "--quiet", "--clear", "--python", python_version, str(env_dir)],
+        [_UV, "pip", "install", "--quiet", "--python", str(interp), *dependencies],
+    ):
+        timeout = ENV_BUILD_TIMEOUT_SECONDS
+        if deadline is not None:
+            timeout = min(timeout, max(deadline - time.monotonic(), 0))
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False,
+            )
+            error = result.stderr.strip() if result.returncode != 0 else None
+        except (OSError, subprocess.TimeoutExpired) as e:
+            error = str(e)
+        if error is not None:
+            logger.warning(f"Building env {key} failed: {error}")
+            shutil.rmtree(env_dir, ignore_errors=True)
+            return False
+    (env_dir / ENV_READY_MARKER).touch()
+    logger.info(f"Built env {key} for python {python_version} deps={dependencies}")
+    return True
+
+
+def _prune_env_cache(keep: str) -> None:
+    """
+    Delete the least recently used venvs in ENV_CACHE_DIR beyond ENV_CACHE_MAX_ENTRIES.
+
+    Scans the directory rather than _ENV_CACHE so venvs left by earlier runs and other
+    server processes count too. Recency is the mtime of ENV_READY_MARKER, which every
+    use refreshes; a venv is deleted under its build lock, and skipped if it was used
+    while the lock was awaited.
+    """
+    envs = []
+    for marker in ENV_CACHE_DIR.glob(f"*/{ENV_READY_MARKER}"):
+        try:
+            envs.append((marker.stat().st_mtime_ns, marker.parent.name))
+        except OSError:
+            continue  # Deleted meanwhile
+    envs.sort(reverse=True)
+    for mtime, old_key in envs[ENV_CACHE_MAX_ENTRIES:]:
+        if old_key == keep:
             continue
-        raw = m.group(1)
-        # Take top-level package name (segment before dot)
-        top = raw.split(".")[0]
-        detected.add(top)
+        env_dir = ENV_CACHE_DIR / old_key
+        with _env_build_lock(old_key):
+            try:
+                if (env_dir / ENV_READY_MARKER).stat().st_mtime_ns != mtime:
+                    continue
+            except OSError:
+                continue
+            with _ENV_CACHE_LOCK:
+                _ENV_CACHE.pop(old_key, None)
+            shutil.rmtree(env_dir, ignore_errors=True)
+            (ENV_CACHE_DIR / f"{old_key}.lock").unlink(missing_ok=True)
+            logger.info(f"Evicted env {old_key}")
+
+
+def _env_build_failed_recently(key: str) -> bool:
+    # Caller holds _ENV_CACHE_LOCK
+    failed_at = _ENV_CACHE_FAILED.get(key)
+    return (
+        failed_at is not None and time.monotonic() - failed_at < ENV_BUILD_RETRY_SECONDS
+    )
+
 
-    # Basic skip list for common stdlib / internal modules
-    skip = {
+def _ensure_dep_env(
+    python_version: str, dependencies: list[str], deadline: float | None = None
+) -> Path | None:
+    """
+    Return the interpreter of a cached venv with the given dependencies installed,
+    building it with 'uv venv' + 'uv pip install' on first use. A build does not
+    run past deadline (a time.monotonic() value, None for no limit), the end of
+    the caller's timeout_seconds.
+
+    A venv only counts as built once its ENV_READY_MARKER file exists, so a
+    half-installed environment is rebuilt rather than picked up; that includes a
+    cached venv deleted behind this process's back. Concurrent cold starts for the
+    same key wait on one build (see _env_build_lock). A failed build is retried
+    once ENV_BUILD_RETRY_SECONDS have passed; one cut short by deadline is not
+    counted as failed.
+
+    Returns:
+        Path to the venv's python, or None if the build failed (callers then
+        fall back to 'uv run --with', which reports the resolution error).
+    """
+    key = _env_cache_key(python_version, dependencies)
+    env_dir = ENV_CACHE_DIR / key
+    marker = env_dir / ENV_READY_MARKER
+    with _ENV_CACHE_LOCK:
+        if _env_build_failed_recently(key):
+            return None
+        cached = _ENV_CACHE.get(key)
+    if cached is not None:
+        try:
+            os.utime(marker)  # Marks the use for _prune_env_cache
+            return cached
+        except OSError:
+            with _ENV_CACHE_LOCK:
+                _ENV_CACHE.pop(key, None)
+    interp = _venv_python(env_dir)
+    built = False
+    with _env_build_lock(key):
+        # Another thread or server process may have built (or failed) it meanwhile
+        with _ENV_CACHE_LOCK:
+            if _env_build_failed_recently(key):
+                return None
+        if marker.exists():
+            os.utime(marker)
+        elif _build_dep_env(
+            key, env_dir, python_version, dependencies, deadline=deadline
+        ):
+            built = True
+        else:
+            now = time.monotonic()
+            if deadline is None or now < deadline:
+                with _ENV_CACHE_LOCK:
+                    _ENV_CACHE_FAILED[key] = now
+            return None
+        with _ENV_CACHE_LOCK:
+            _ENV_CACHE_FAILED.pop(key, None)
+            _ENV_CACHE[key] = interp
+    if built:
+        _prune_env_cache(keep=key)
+    return interp
+
+
+# Matches 'import x.y' / 'from x.y import ...' at the start of any (possibly indented)
+# line; the group stops at the first dot, so it is already the top-level package.
+_IMPORT_RE = re.compile(r"^[ \t]*(?:from|import)[ \t]+([a-zA-Z0-9_]+)", re.MULTILINE)
+
+# Basic skip list for common stdlib / internal modules
+_IMPORT_SKIP = frozenset(
+    {
         "sys",
         "os",
         "re",
@@ -238,8 +583,25 @@ def _parse_imports(source_text: str) -> list[str]:
         "concurrent",
         "queue",
     }
+)
+
 
-    return [pkg for pkg in sorted(detected) if pkg not in skip]
+# Saved scripts are scanned for imports only up to this many bytes
+_IMPORT_SCAN_BYTES = 64 * 1024
+
+
+def _parse_imports(source_text: str) -> list[str]:
+    """
+    Parse import statements from Python source and return top-level package names.
+
+    Args:
+        source_text: Python source code
+
+    Returns:
+        List of top-level package names (excluding stdlib)
+    """
+    detected = {m.group(1) for m in _IMPORT_RE.finditer(source_text)}
+    return [pkg for pkg in sorted(detected) if pkg not in _IMPORT_SKIP]
 
 
 # ---------------------------
@@ -247,10 +609,31 @@ def _parse_imports(source_text: str) -> list[str]:
 # ---------------------------
 
 
+@functools.lru_cache(maxsize=32)
+def _load_env_file_cached(
+    path: str, mtime_ns: int, size: int
+) -> tuple[tuple[str, str], ...]:
+    """
+    Parse a .env file once per (path, mtime, size).
+
+    mtime and size are part of the cache key so edits to the file invalidate the
+    entry, including a rewrite within the filesystem's timestamp granularity.
+    An immutable tuple of pairs is returned so cached values cannot be mutated by callers.
+    """
+    # dotenv_values returns a dict with all values from the .env file
+    # It handles comments, quotes, multiline values, etc.
+    env_dict = dotenv_values(path)
+
+    # Filter out None values (keys without a value)
+    return tuple((k, v) for k, v in env_dict.items() if v is not None)
+
+
 def _load_env_file(env_file: Path) -> dict[str, str]:
     """
     Load environment variables from a .env file using python-dotenv.
 
+    Parsed results are cached by path, modification time and size.
+
     Args:
         env_file: Path to .env file
 
@@ -260,21 +643,28 @@ def _load_env_file(env_file: Path) -> dict[str, str]:
     Raises:
         FileNotFoundError: If the env_file does not exist
     """
-    if not env_file.exists():
-        raise FileNotFoundError(f"Environment file not found: {env_file}")
+    return dict(_env_file_items(env_file))
 
-    # dotenv_values returns a dict with all values from the .env file
-    # It handles comments, quotes, multiline values, etc.
-    env_dict = dotenv_values(env_file)
 
-    # Filter out None values and convert to dict[str, str]
-    return {k: v for k, v in env_dict.items() if v is not None}
+def _env_file_items(env_file: Path) -> tuple[tuple[str, str], ...]:
+    """
+    The cached (key, value) pairs of a .env file, for merging without a dict copy.
+
+    Raises:
+        FileNotFoundError: If the env_file does not exist
+    """
+    try:
+        st = os.stat(env_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Environment file not found: {env_file}") from None
+
+    return _load_env_file_cached(os.fspath(env_file), st.st_mtime_ns, st.st_size)
 
 
 def _build_process_env(
     env_vars: dict[str, str] | None = None,
     env_file: Path | None = None,
-) -> dict[str, str]:
+) -> dict[str, str] | None:
     """
     Build the environment dictionary for subprocess execution.
 
@@ -288,15 +678,18 @@ def _build_process_env(
         env_file: Optional path to .env file
 
     Returns:
-        Merged environment dictionary
+        Merged environment dictionary, or None when there is nothing to add: the
+        child then inherits the environment without copying os.environ
     """
+    if not env_vars and not env_file:
+        return None
+
     # Start with inherited environment
     proc_env = os.environ.copy()
 
     # Load and merge .env file if provided
     if env_file:
-        file_vars = _load_env_file(env_file)
-        proc_env.update(file_vars)
+        proc_env.update(_env_file_items(env_file))
 
     # Merge explicit env_vars (highest priority)
     if env_vars:
@@ -305,27 +698,22 @@ def _build_process_env(
     return proc_env
 
 
-def _infer_python_version_from_pyproject(workdir: Path) -> str | None:
-    """
-    Infer an exact minor python version (e.g. '3.13') from the project's pyproject.toml
-    requires-python field if present. Returns None if not found or parsing fails.
+# First 'major.minor' in a requires-python spec
+_PY_MINOR_RE = re.compile(r"(\d+\.\d+)")
 
-    Strategy:
-      - Look for project.requires-python (PEP 621)
-      - Extract first occurrence of \\d+.\\d+ from the version spec (e.g. '>=3.13' -> '3.13')
+
+@functools.lru_cache(maxsize=128)
+def _infer_python_version_cached(path: str, mtime_ns: int) -> str | None:
+    """
+    Parse a pyproject.toml's requires-python once per (path, mtime) pair.
     """
-    pyproject = workdir / "pyproject.toml"
-    if not pyproject.is_file():
-        return None
     try:
-        import re
-        import tomllib
-
-        data = tomllib.loads(pyproject.read_text())
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
         requires = data.get("project", {}).get("requires-python")
         if not requires:
             return None
-        match = re.search(r"(\\d+\\.\\d+)", requires)
+        match = _PY_MINOR_RE.search(requires)
         if match:
             return match.group(1)
     except Exception:
@@ -333,95 +721,264 @@ def _infer_python_version_from_pyproject(workdir: Path) -> str | None:
     return None
 
 
+def _infer_python_version_from_pyproject(workdir: Path) -> str | None:
+    """
+    Infer an exact minor python version (e.g. '3.13') from the project's pyproject.toml
+    requires-python field if present. Returns None if not found or parsing fails.
+
+    Strategy:
+      - Look for project.requires-python (PEP 621)
+      - Extract first occurrence of \\d+.\\d+ from the version spec (e.g. '>=3.13' -> '3.13')
+
+    Results are cached by path and modification time, so only the stat is paid
+    while the file is unchanged.
+    """
+    pyproject = os.path.join(workdir, "pyproject.toml")
+    try:
+        st = os.stat(pyproject)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return _infer_python_version_cached(pyproject, st.st_mtime_ns)
+
+
 # ---------------------------
 # Internal execution helpers
 # ---------------------------
 
 
-def _exec_script_in_dir_sync(
-    directory: Path,
-    script_path: Path | None,
-    script_content: str | None,
-    args: list[str] | None,
-    use_uv: bool,
-    python_version: str | None,
-    timeout_seconds: int,
-    env_vars: dict[str, str] | None = None,
-    env_file: Path | None = None,
-) -> RunScriptResult:
-    workdir = Path(directory).expanduser().resolve()
-    if not workdir.is_dir():
+def _write_inline_script(content: str, prefix: str = "inline_") -> Path:
+    """
+    Write inline script content to a file under INLINE_TMP_DIR, reusing a pooled
+    file when one is free.
+
+    Returns:
+        Path of the file; the caller must hand it back via _release_inline_script
+    """
+    with _INLINE_POOL_LOCK:
+        path = _INLINE_POOL.pop() if _INLINE_POOL else None
+    fd = -1
+    if path is not None:
+        try:
+            # Never follow a symlink swapped in for a pooled file
+            fd = os.open(path, os.O_WRONLY | os.O_TRUNC | getattr(os, "O_NOFOLLOW", 0))
+        except OSError:
+            pass  # Gone or replaced: take a fresh file instead
+    if fd < 0:
+        fd, name = tempfile.mkstemp(suffix=".py", prefix=prefix, dir=INLINE_TMP_DIR)
+        path = Path(name)
+    with os.fdopen(fd, "wb") as f:
+        f.write(content.encode("utf-8"))
+    return path
+
+
+def _release_inline_script(path: Path) -> None:
+    """
+    Return an inline script file to the pool, or unlink it if the pool is full.
+    """
+    with _INLINE_POOL_LOCK:
+        if len(_INLINE_POOL) < INLINE_POOL_SIZE:
+            _INLINE_POOL.append(path)
+            return
+    path.unlink(missing_ok=True)
+
+
+@atexit.register
+def _drain_inline_pool() -> None:
+    with _INLINE_POOL_LOCK:
+        paths = _INLINE_POOL[:]
+        _INLINE_POOL.clear()
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def _resolve_dir(directory: Path) -> Path:
+    """
+    Absolutize a directory argument and verify it exists with a single stat.
+
+    os.path.abspath is used instead of Path.resolve() so symlinks are not walked
+    component by component on every tool call.
+
+    Raises:
+        FileNotFoundError: If the path does not exist or is not a directory
+    """
+    workdir = Path(os.path.abspath(os.path.expanduser(directory)))
+    try:
+        is_dir = stat.S_ISDIR(os.stat(workdir).st_mode)
+    except OSError:
+        is_dir = False
+    if not is_dir:
         raise FileNotFoundError(f"Directory not found: {workdir}")
-    if script_content:
-        inline_dir = workdir / "inline_scripts"
-        inline_dir.mkdir(parents=True, exist_ok=True)
-        tmp_name = f"inline_{uuid.uuid4().hex}.py"
-        script_path_local = inline_dir / tmp_name
-        script_path_local.write_text(script_content)
-        is_inline = True
-    else:
-        if not script_path:
-            raise ValueError(
-                "Either 'script_path' or 'script_content' must be provided."
-            )
-        candidate = script_path.expanduser()
-        if not candidate.is_absolute():
-            candidate = (workdir / candidate).resolve()
-        script_path_local = candidate.resolve()
-        if not script_path_local.is_file():
-            raise FileNotFoundError(f"Script file not found: {script_path_local}")
-        is_inline = False
-    command: list[str]
-    execution_strategy = "system-python"
-    if use_uv:
-        command = ["uv", "run"]
-        # Infer python version from pyproject.toml if not explicitly provided.
-        if not python_version:
-            python_version = _infer_python_version_from_pyproject(workdir)
-        if python_version:
-            command += ["--python", python_version]
-        execution_strategy = "uv-run"
-    else:
-        command = ["python"]
-    command.append(str(script_path_local))
-    if args:
-        command.extend(args)
-    # Build environment
-    proc_env = _build_process_env(env_vars=env_vars, env_file=env_file)
+    return workdir
+
+
+def _resolve_script(script_path: Path, base: Path | None = None) -> Path:
+    """
+    Absolutize a script path (relative paths are taken against 'base' when given,
+    else the current directory) and verify it is a regular file with a single stat.
 
-    start = time.time()
+    Raises:
+        FileNotFoundError: If the path does not exist or is not a regular file
+    """
+    candidate = os.path.expanduser(script_path)
+    if base is not None and not os.path.isabs(candidate):
+        candidate = os.path.join(base, candidate)
+    spath = Path(os.path.abspath(candidate))
     try:
-        proc = subprocess.Popen(
-            command,
-            cwd=str(workdir),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            env=proc_env,
-        )
+        is_file = stat.S_ISREG(os.stat(spath).st_mode)
+    except OSError:
+        is_file = False
+    if not is_file:
+        raise FileNotFoundError(f"Script not found: {spath}")
+    return spath
+
+
+def _decode_output(data: bytes | bytearray, final: bool = True) -> str:
+    """
+    Decode captured process output. All output is kept as bytes until it is returned,
+    and decoded here once; invalid UTF-8 is replaced rather than raising.
+
+    With final=False (output of a still-running process) an incomplete multi-byte
+    sequence at the end is left out instead of being replaced, since the rest of
+    the character may still be in the pipe.
+    """
+    if final:
+        return data.decode("utf-8", "replace")
+    return codecs.getincrementaldecoder("utf-8")("replace").decode(data, final=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _scripts_dir_for(cwd: str) -> Path:
+    return Path(cwd) / "scripts"
+
+
+def _scripts_dir() -> Path:
+    """
+    Return the saved-scripts folder ('scripts/' under the current working directory).
+    """
+    return _scripts_dir_for(os.getcwd())
+
+
+_READ_CHUNK = 1 << 16
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _drain_fd(fd: int, buf: bytearray) -> bool:
+    """
+    Read everything currently available from a non-blocking fd into buf.
+
+    A short read means the pipe has been emptied, so it ends the drain without a
+    further read just to collect EAGAIN; callers are readiness-driven and come back
+    when more data (or EOF) arrives.
+
+    Returns:
+        False once the fd has reached EOF, True otherwise.
+    """
+    while True:
         try:
-            stdout, stderr = proc.communicate(
-                timeout=None if timeout_seconds == 0 else timeout_seconds
-            )
-        except subprocess.TimeoutExpired:
-            proc.kill()
-            stdout, stderr = proc.communicate()
-            stderr += "\n[TIMEOUT]"
-    finally:
-        if is_inline and script_path_local.exists():
-            try:
-                script_path_local.unlink()
-            except Exception:
-                pass
-    return RunScriptResult(
-        stdout=stdout,
-        stderr=stderr,
-        exit_code=proc.returncode,
-        execution_strategy=execution_strategy,
-        elapsed_seconds=time.time() - start,
+            data = os.read(fd, _READ_CHUNK)
+        except BlockingIOError:
+            return True
+        if not data:
+            return False
+        buf.extend(data)
+        if len(data) < _READ_CHUNK:
+            return True
+
+
+async def _read_stream(
+    stream: asyncio.StreamReader,
+    buf: bytearray,
+    on_text: Callable[[str], None] | None = None,
+) -> None:
+    """
+    Append everything from an asyncio stream to buf until EOF, without intermediate bytes copies.
+
+    If on_text is given it receives each chunk as it arrives, decoded incrementally so
+    multi-byte characters split across reads are passed on whole.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    while chunk := await stream.read(_READ_CHUNK):
+        buf.extend(chunk)
+        if on_text is not None and (text := decoder.decode(chunk)):
+            on_text(text)
+
+
+def _reap_with_rusage(proc: subprocess.Popen, options: int = 0) -> Any:
+    """
+    Reap proc with os.wait4 so its resource usage (including reaped descendants) is kept.
+
+    Returns:
+        The rusage struct, or None if options has WNOHANG and proc is still running.
+    """
+    pid, status, rusage = os.wait4(proc.pid, options)
+    if pid == 0:
+        return None
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return rusage
+
+
+@functools.lru_cache(maxsize=16)
+def _which(cmd: str, path: str | None) -> str:
+    """
+    Resolve cmd against the PATH the child will get (cached per PATH value), so
+    spawning skips execvp's per-directory lookup; the bare name if not found.
+    """
+    return shutil.which(cmd, path=path) or cmd
+
+
+def _uses_project_env(workdir: Path) -> bool:
+    """
+    Whether 'uv run' in workdir would pick up a project or virtual environment: a
+    pyproject.toml or .venv in workdir or any parent, or an active VIRTUAL_ENV.
+    """
+    if os.environ.get("VIRTUAL_ENV"):
+        return True
+    return any(
+        os.path.exists(d / "pyproject.toml") or os.path.isdir(d / ".venv")
+        for d in (workdir, *workdir.parents)
     )
 
 
+def _with_flags(dependencies: list[str]) -> list[str]:
+    """
+    Expand dependencies into uv's repeated '--with <dep>' arguments.
+    """
+    return [arg for dep in dependencies for arg in ("--with", dep)]
+
+
+def _deps_command(
+    spath: Path,
+    python_version: str,
+    dependencies: list[str],
+    args: list[str] | None,
+    interp: str | Path | None,
+    isolated: bool = False,
+) -> tuple[str, list[str]]:
+    """
+    Build the command for a dependency run and name its execution strategy: exec
+    'interp' (a cached venv's python for dependencies, else the bare interpreter)
+    when one was found, otherwise resolve through 'uv run --with'.
+    """
+    if interp:
+        strategy = "cached-env" if dependencies else "system-python"
+        command = [str(interp)]
+    else:
+        strategy = "uv-run"
+        command = [_UV, "run"]
+        # --isolated ignores pyproject.toml requirements for standalone scripts
+        if isolated:
+            command.append("--isolated")
+        command += ["--python", python_version]
+        command += _with_flags(dependencies)
+    command.append(str(spath))
+    if args:
+        command.extend(args)
+    return strategy, command
+
+
+@_limit_concurrency
 def _exec_with_dependencies_sync(
     script_content: str | None,
     script_path: Path | None,
@@ -432,59 +989,74 @@ def _exec_with_dependencies_sync(
     env_vars: dict[str, str] | None = None,
     env_file: Path | None = None,
 ) -> RunWithDepsResult:
+    """
+    Blocking variant of py_run_script_with_dependencies for use outside the event loop
+    (tests, examples, scripts). Async callers use py_run_script_with_dependencies so the
+    subprocess wait does not stall other jobs.
+    """
     if not script_content and not script_path:
         raise ValueError("Provide either 'script_content' or 'script_path'.")
     if script_content and script_path:
         raise ValueError("Provide only one of 'script_content' or 'script_path'.")
     if script_path:
-        spath = Path(script_path).expanduser().resolve()
-        if not spath.is_file():
-            raise FileNotFoundError(f"Script not found: {spath}")
+        spath = _resolve_script(script_path)
+        source_text = spath.read_text()
         is_inline = False
     else:
-        spath = Path(f"inline_dep_{uuid.uuid4().hex}.py").resolve()
-        spath.write_text(script_content or "")
+        source_text = script_content or ""
+        spath = _write_inline_script(source_text, prefix="inline_dep_")
         is_inline = True
-    command: list[str] = ["uv", "run", "--python", python_version]
     resolved_dependencies = dependencies[:] if dependencies else []
-    for dep in resolved_dependencies:
-        command += ["--with", dep]
-    command.append(str(spath))
-    if args:
-        command.extend(args)
+    # Building the venv counts against timeout_seconds; the script gets what is left
+    deadline = None if timeout_seconds == 0 else time.monotonic() + timeout_seconds
+    # Outside a project, exec a cached venv for the dependencies (or the bare
+    # interpreter without any) instead of resolving through 'uv run' each call.
+    # A PEP 723 header declares its own dependencies, which only 'uv run' reads.
+    interp = None
+    if "# /// script" not in source_text and not _uses_project_env(Path.cwd()):
+        if resolved_dependencies:
+            interp = _ensure_dep_env(python_version, resolved_dependencies, deadline)
+        else:
+            interp = _INTERP_PATH_CACHE.get(python_version) or _find_interpreter(
+                python_version
+            )
+    execution_strategy, command = _deps_command(
+        spath, python_version, resolved_dependencies, args, interp
+    )
 
     # Build environment
     proc_env = _build_process_env(env_vars=env_vars, env_file=env_file)
 
-    start = time.time()
+    start = time.monotonic()
     try:
         proc = subprocess.Popen(
             command,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             env=proc_env,
         )
         try:
-            stdout, stderr = proc.communicate(
-                timeout=None if timeout_seconds == 0 else timeout_seconds
+            stdout_bytes, stderr_bytes = proc.communicate(
+                timeout=None
+                if deadline is None
+                else max(deadline - time.monotonic(), 0)
             )
+            stdout = _decode_output(stdout_bytes)
+            stderr = _decode_output(stderr_bytes)
         except subprocess.TimeoutExpired:
             proc.kill()
-            stdout, stderr = proc.communicate()
-            stderr += "\n[TIMEOUT]"
+            stdout_bytes, stderr_bytes = proc.communicate()
+            stdout = _decode_output(stdout_bytes)
+            stderr = _decode_output(stderr_bytes) + "\n[TIMEOUT]"
     finally:
-        if is_inline and spath.exists():
-            try:
-                spath.unlink()
-            except Exception:
-                pass
-    return RunWithDepsResult(
+        if is_inline:
+            _release_inline_script(spath)
+    return RunWithDepsResult.model_construct(
         stdout=stdout,
         stderr=stderr,
         exit_code=proc.returncode,
-        execution_strategy="uv-run",
-        elapsed_seconds=time.time() - start,
+        execution_strategy=execution_strategy,
+        elapsed_seconds=time.monotonic() - start,
         resolved_dependencies=resolved_dependencies,
         python_version_used=python_version,
     )
@@ -492,6 +1064,7 @@ def _exec_with_dependencies_sync(
 
 @mcp.tool(tags=["execution"])
 @smart_async(default_timeout=20.0)
+@_limit_concurrency
 async def py_run_script_in_dir(
     directory: Path,
     script_path: Path | None = None,
@@ -505,6 +1078,8 @@ async def py_run_script_in_dir(
     async_mode: bool = False,
     job_label: str | None = None,
     auto_install_deps: bool = True,
+    capture_output: bool = True,
+    combine_streams: bool = False,
 ) -> RunScriptResult | dict[str, Any]:
     """
     Execute a Python script (existing file or inline content) inside a target directory using uv or system Python.
@@ -516,7 +1091,9 @@ async def py_run_script_in_dir(
         script_path: Absolute or relative path to script within directory. Mutually exclusive with script_content.
         script_content: Inline Python source. When provided, a temporary file is created (script_path must be None).
         args: Optional argument list appended after the script path.
-        use_uv: When True use 'uv run'; otherwise system 'python'.
+        use_uv: When True use 'uv run'; otherwise system 'python'. Scripts that need nothing
+                from uv (no detected dependencies, inline metadata, project or venv) run
+                directly on the interpreter for python_version.
         python_version: Exact minor version (e.g. '3.12') – honored only when use_uv=True.
         timeout_seconds: Max wall time for subprocess; 0 disables timeout (unbounded).
         env_vars: Optional dictionary of environment variables to set for the script.
@@ -524,6 +1101,11 @@ async def py_run_script_in_dir(
         async_mode: If True, launch in background immediately (default: False).
         job_label: Optional label for job tracking.
         auto_install_deps: If True, auto-detect and install missing dependencies (default: True).
+        capture_output: If False, discard stdout/stderr (sent to /dev/null) and only report
+                        the exit code (default: True).
+        combine_streams: If True, the script's stderr is sent into the same pipe as stdout
+                         and returned interleaved in 'stdout'; 'stderr' is empty
+                         (default: False).
 
     Returns:
         RunScriptResult if completed synchronously, or job metadata if switched to background.
@@ -537,19 +1119,13 @@ async def py_run_script_in_dir(
 
     Notes:
         - No sandboxing; full filesystem/network access (per project requirements).
-        - Temporary inline file removed after completion.
+        - Temporary inline file released to the reuse pool after completion.
     """
 
-    workdir = Path(directory).expanduser().resolve()
-    if not workdir.is_dir():
-        raise FileNotFoundError(f"Directory not found: {workdir}")
+    workdir = _resolve_dir(directory)
 
     if script_content:
-        inline_dir = workdir / "inline_scripts"
-        inline_dir.mkdir(parents=True, exist_ok=True)
-        tmp_name = f"inline_{uuid.uuid4().hex}.py"
-        script_path_local = inline_dir / tmp_name
-        script_path_local.write_text(script_content)
+        script_path_local = _write_inline_script(script_content)
         source_text = script_content
     else:
         if not script_path:
@@ -557,12 +1133,7 @@ async def py_run_script_in_dir(
                 "Either 'script_path' or 'script_content' must be provided."
             )
         # Allow relative paths (to the provided directory) as well as absolute.
-        candidate = script_path.expanduser()
-        if not candidate.is_absolute():
-            candidate = (workdir / candidate).resolve()
-        script_path_local = candidate.resolve()
-        if not script_path_local.is_file():
-            raise FileNotFoundError(f"Script file not found: {script_path_local}")
+        script_path_local = _resolve_script(script_path, base=workdir)
         source_text = script_path_local.read_text()
 
     # Auto-detect dependencies if enabled
@@ -572,91 +1143,119 @@ async def py_run_script_in_dir(
         if detected_deps:
             logger.info(f"Auto-detected dependencies: {detected_deps}")
 
+    # Build environment
+    proc_env = _build_process_env(env_vars=env_vars, env_file=env_file)
+
     command: list[str]
     execution_strategy = "system-python"
-    if use_uv:
-        command = ["uv", "run"]
+    if use_uv and not python_version:
+        python_version = _infer_python_version_from_pyproject(workdir)
+
+    # Without dependencies, inline script metadata or a project/venv for uv to pick
+    # up, 'uv run' would only exec the interpreter; run that directly instead.
+    interp = None
+    if (
+        use_uv
+        and python_version
+        and not detected_deps
+        and "# /// script" not in source_text
+        and not _uses_project_env(workdir)
+    ):
+        interp = _INTERP_PATH_CACHE.get(python_version)
+        if interp is None:
+            await asyncio.to_thread(_ensure_python_version, python_version)
+            interp = await asyncio.to_thread(_find_interpreter, python_version)
+
+    if interp:
+        command = [interp]
+    elif use_uv:
+        command = [_UV, "run"]
 
         # Use --isolated to ignore pyproject.toml when running standalone scripts with auto-deps
         if detected_deps:
             command.append("--isolated")
 
-        if not python_version:
-            python_version = _infer_python_version_from_pyproject(workdir)
-
         # If we have a version requirement, ensure it's installed
         if python_version:
-            _ensure_python_version(python_version)
+            await asyncio.to_thread(_ensure_python_version, python_version)
             command += ["--python", python_version]
 
         # Add auto-detected dependencies
-        for dep in detected_deps:
-            command += ["--with", dep]
+        command += _with_flags(detected_deps)
 
         execution_strategy = "uv-run"
     else:
-        command = ["python"]
+        command = [_which("python", (proc_env or os.environ).get("PATH"))]
 
     command.append(str(script_path_local))
     if args:
         command.extend(args)
 
-    # Build environment
-    proc_env = _build_process_env(env_vars=env_vars, env_file=env_file)
-
     # Async execution using asyncio subprocess
-    start = time.time()
+    start = time.monotonic()
 
     # Get output callback for streaming (always enabled for background jobs)
     from .smart_async import create_output_callback, current_job_id
 
     output_callback = create_output_callback()
 
+    pipe = asyncio.subprocess.PIPE if capture_output else asyncio.subprocess.DEVNULL
     try:
         proc = await asyncio.create_subprocess_exec(
             *command,
             cwd=str(workdir),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stdout=pipe,
+            # Merged in the kernel: one pipe and one reader instead of two
+            stderr=asyncio.subprocess.STDOUT
+            if capture_output and combine_streams
+            else pipe,
             env=proc_env,
         )
 
-        # If we have a job context (background job), read line by line for streaming
-        if current_job_id.get() and output_callback:
-            stdout_lines = []
-            stderr_lines = []
-
-            async def read_stdout():
-                while True:
-                    line = await proc.stdout.readline()
-                    if not line:
-                        break
-                    text = line.decode("utf-8")
-                    stdout_lines.append(text)
-                    output_callback(stdout=text, stderr="")
-
-            async def read_stderr():
-                while True:
-                    line = await proc.stderr.readline()
-                    if not line:
-                        break
-                    text = line.decode("utf-8")
-                    stderr_lines.append(text)
-                    output_callback(stdout="", stderr=text)
-
+        if not capture_output:
+            stdout = ""
+            stderr = ""
             try:
-                # Read both streams concurrently with timeout
                 await asyncio.wait_for(
-                    asyncio.gather(read_stdout(), read_stderr(), proc.wait()),
+                    proc.wait(),
                     timeout=None if timeout_seconds == 0 else timeout_seconds,
                 )
-                stdout = "".join(stdout_lines)
-                stderr = "".join(stderr_lines)
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 proc.kill()
                 await proc.wait()
-                stdout = "".join(stdout_lines)
-                stderr = "".join(stderr_lines) + "\n[TIMEOUT]"
+                stderr = "[TIMEOUT]"
+        # If we have a job context (background job), forward output as it arrives
+        elif current_job_id.get() and output_callback:
+            stdout_buf = bytearray()
+            stderr_buf = bytearray()
+            readers = [
+                _read_stream(
+                    proc.stdout,
+                    stdout_buf,
+                    lambda text: output_callback(stdout=text, stderr=""),
+                )
+            ]
+            if proc.stderr is not None:
+                readers.append(
+                    _read_stream(
+                        proc.stderr,
+                        stderr_buf,
+                        lambda text: output_callback(stdout="", stderr=text),
+                    )
+                )
+            try:
+                # Read the streams concurrently with timeout
+                await asyncio.wait_for(
+                    asyncio.gather(*readers, proc.wait()),
+                    timeout=None if timeout_seconds == 0 else timeout_seconds,
+                )
+                stdout = _decode_output(stdout_buf)
+                stderr = _decode_output(stderr_buf)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                stdout = _decode_output(stdout_buf)
+                stderr = _decode_output(stderr_buf) + "\n[TIMEOUT]"
         else:
             # Non-streaming: wait for completion
             try:
@@ -664,40 +1263,36 @@ async def py_run_script_in_dir(
                     proc.communicate(),
                     timeout=None if timeout_seconds == 0 else timeout_seconds,
                 )
-                stdout = stdout_bytes.decode("utf-8")
-                stderr = stderr_bytes.decode("utf-8")
-            except asyncio.TimeoutError:
+                stdout = _decode_output(stdout_bytes)
+                stderr = _decode_output(stderr_bytes or b"")
+            except TimeoutError:
                 proc.kill()
                 await proc.wait()
-                result = RunScriptResult(
+                result = RunScriptResult.model_construct(
                     stdout="",
                     stderr="[TIMEOUT]",
                     exit_code=-1,
                     execution_strategy=execution_strategy,
-                    elapsed_seconds=time.time() - start,
+                    elapsed_seconds=time.monotonic() - start,
                 )
                 return result.model_dump()
     finally:
         if script_content:
-            # Clean up temp script file
-            if script_path_local.exists():
-                try:
-                    script_path_local.unlink()
-                except Exception:
-                    pass
+            _release_inline_script(script_path_local)
 
-    result = RunScriptResult(
+    result = RunScriptResult.model_construct(
         stdout=stdout,
         stderr=stderr,
         exit_code=proc.returncode or 0,
         execution_strategy=execution_strategy,
-        elapsed_seconds=time.time() - start,
+        elapsed_seconds=time.monotonic() - start,
     )
     return result.model_dump()
 
 
 @mcp.tool(tags=["execution", "dependencies"])
 @smart_async(default_timeout=20.0)
+@_limit_concurrency
 async def py_run_script_with_dependencies(
     script_content: str | None = None,
     script_path: Path | None = None,
@@ -711,6 +1306,7 @@ async def py_run_script_with_dependencies(
     async_mode: bool = False,
     job_label: str | None = None,
     ignore_project_requirements: bool = True,
+    combine_streams: bool = False,
 ) -> RunWithDepsResult | dict[str, Any]:
     """
     Execute transient inline code or an existing script inside an ephemeral uv environment with explicit dependencies.
@@ -731,6 +1327,8 @@ async def py_run_script_with_dependencies(
         async_mode: If True, launch in background immediately (default: False).
         job_label: Optional label for job tracking.
         ignore_project_requirements: If True, use --isolated to ignore pyproject.toml (default: True).
+        combine_streams: If True, stderr is merged into stdout (interleaved in 'stdout';
+                         'stderr' is empty) (default: False).
 
     Returns:
         RunWithDepsResult if completed synchronously, or job metadata if switched to background.
@@ -740,10 +1338,14 @@ async def py_run_script_with_dependencies(
         ValueError: Exclusivity violated.
 
     Notes:
-        - Uses 'uv run --with <dep>' for each dependency.
+        - Isolated runs with dependencies exec a venv cached under ENV_CACHE_DIR, keyed by
+          hash(deps+python_version) and built once with 'uv venv' + 'uv pip install'.
+          If the build fails, falls back to 'uv run --with <dep>' for each dependency.
+        - Isolated runs with no dependencies exec the interpreter found by 'uv python find' directly.
+        - Scripts with a PEP 723 '# /// script' header always go through 'uv run' so the
+          dependencies declared in the header are installed.
         - Auto-import parsing is heuristic: it treats 'from pkg.sub import X' and 'import pkg.sub' both as 'pkg'.
         - Built-in / stdlib modules are not filtered exhaustively; a small skip list is applied.
-        - Future: environment caching keyed by hash(deps+python_version).
     """
 
     if not script_content and not script_path:
@@ -752,83 +1354,90 @@ async def py_run_script_with_dependencies(
         raise ValueError("Provide only one of 'script_content' or 'script_path'.")
 
     if script_path:
-        spath = Path(script_path).expanduser().resolve()
-        if not spath.is_file():
-            raise FileNotFoundError(f"Script not found: {spath}")
+        spath = _resolve_script(script_path)
         source_text = spath.read_text()
     else:
-        inline_dir = Path.cwd() / "inline_scripts"
-        inline_dir.mkdir(parents=True, exist_ok=True)
-        spath = (inline_dir / f"inline_dep_{uuid.uuid4().hex}.py").resolve()
         source_text = script_content or ""
-        spath.write_text(source_text)
+        spath = _write_inline_script(source_text, prefix="inline_dep_")
 
     # Build initial dependency list
     resolved_dependencies = dependencies[:] if dependencies else []
 
     if auto_parse_imports:
         detected = _parse_imports(source_text)
-        for pkg in detected:
-            if pkg not in resolved_dependencies:
-                resolved_dependencies.append(pkg)
+        seen = set(resolved_dependencies)
+        resolved_dependencies += [pkg for pkg in detected if pkg not in seen]
         logger.info(
             "auto_parse_imports detected=%s final_deps=%s",
-            sorted(detected),
+            detected,
             resolved_dependencies,
         )
 
-    command: list[str] = ["uv", "run"]
-
-    # Use --isolated to ignore pyproject.toml requirements when running standalone scripts
-    if ignore_project_requirements:
-        command.append("--isolated")
-
-    # Ensure Python version is installed
-    _ensure_python_version(python_version)
-
-    command += ["--python", python_version]
-    for dep in resolved_dependencies:
-        command += ["--with", dep]
-    command.append(str(spath))
-    if args:
-        command.extend(args)
+    # Building the venv counts against timeout_seconds; the script gets what is left
+    deadline = None if timeout_seconds == 0 else time.monotonic() + timeout_seconds
+
+    # Isolated runs need no per-call resolution: without dependencies exec the
+    # interpreter directly, with dependencies exec a cached venv built for them.
+    # A PEP 723 header declares its own dependencies, which only 'uv run' reads.
+    interp = None
+    shortcut = ignore_project_requirements and "# /// script" not in source_text
+    if shortcut and not resolved_dependencies:
+        interp = _INTERP_PATH_CACHE.get(python_version)
+        if interp is None:
+            await asyncio.to_thread(_ensure_python_version, python_version)
+            interp = await asyncio.to_thread(_find_interpreter, python_version)
+    elif shortcut:
+        interp = await asyncio.to_thread(
+            _ensure_dep_env, python_version, resolved_dependencies, deadline
+        )
+    if not interp:
+        await asyncio.to_thread(_ensure_python_version, python_version)
+    execution_strategy, command = _deps_command(
+        spath,
+        python_version,
+        resolved_dependencies,
+        args,
+        interp,
+        isolated=ignore_project_requirements,
+    )
 
     # Build environment
     proc_env = _build_process_env(env_vars=env_vars, env_file=env_file)
 
-    start = time.time()
+    start = time.monotonic()
     try:
         proc = await asyncio.create_subprocess_exec(
             *command,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+            if combine_streams
+            else asyncio.subprocess.PIPE,
             env=proc_env,
         )
         try:
             stdout_bytes, stderr_bytes = await asyncio.wait_for(
                 proc.communicate(),
-                timeout=None if timeout_seconds == 0 else timeout_seconds,
+                timeout=None
+                if deadline is None
+                else max(deadline - time.monotonic(), 0),
             )
-            stdout = stdout_bytes.decode("utf-8")
-            stderr = stderr_bytes.decode("utf-8")
-        except asyncio.TimeoutError:
+            stdout = _decode_output(stdout_bytes)
+            stderr = _decode_output(stderr_bytes or b"")
+        except TimeoutError:
             proc.kill()
             await proc.wait()
             stdout = ""
             stderr = "[TIMEOUT]"
     finally:
-        if script_content and spath.exists():
-            try:
-                spath.unlink()
-            except Exception:
-                pass
+        if script_content:
+            _release_inline_script(spath)
 
-    result = RunWithDepsResult(
+    result = RunWithDepsResult.model_construct(
         stdout=stdout,
         stderr=stderr,
         exit_code=proc.returncode or 0,
-        execution_strategy="uv-run",
-        elapsed_seconds=time.time() - start,
+        execution_strategy=execution_strategy,
+        elapsed_seconds=time.monotonic() - start,
         resolved_dependencies=resolved_dependencies,
         python_version_used=python_version,
     )
@@ -842,29 +1451,34 @@ def py_list_running_jobs() -> list[dict[str, str]]:
 
     Returns:
         List of dicts containing: job_id, running (bool str), exit_code (may be None), pid, elapsed_seconds.
-        If streaming is enabled, includes partial stdout/stderr lengths.
+        If streaming is enabled, includes partial stdout/stderr byte counts.
     """
-    now = time.time()
+    now = time.monotonic()
     out: list[dict[str, str]] = []
-    for jid, rec in JOBS.items():
-        running = not rec.finished and rec.process.poll() is None
-        elapsed = now - rec.start_time
-        exit_code = (
-            str(rec.process.returncode) if rec.process.poll() is not None else ("None")
-        )
-        if running and rec.stream:
-            # Update chunks before reporting (non-blocking read)
+    with _JOBS_LOCK:
+        jobs = list(JOBS.items())
+    for jid, rec in jobs:
+        if not rec.finished and rec.process.poll() is not None:
+            _finalize_capture(rec)
+        if rec.cached_status is not None:
+            out.append(rec.cached_status)
+            continue
+        if rec.stream:
+            # Update chunks before reporting (non-blocking read); pipes on the
+            # event loop are drained there as soon as epoll reports them readable
             _nonblocking_capture(rec)
         out.append(
             {
                 "job_id": jid,
-                "running": str(running),
-                "exit_code": exit_code,
+                "running": "True",
+                "exit_code": "None",
                 "pid": str(rec.process.pid),
-                "elapsed_seconds": f"{elapsed:.2f}",
+                "elapsed_seconds": f"{now - rec.start_monotonic:.2f}",
                 "stream": str(rec.stream),
-                "stdout_chunks": str(len(rec.stdout_chunks)),
-                "stderr_chunks": str(len(rec.stderr_chunks)),
+                "stdout_bytes": str(rec.stdout_len),
+                "stderr_bytes": str(rec.stderr_len),
+                "stdout_dropped": str(rec.stdout_dropped),
+                "stderr_dropped": str(rec.stderr_dropped),
             }
         )
     return out
@@ -893,19 +1507,25 @@ def py_get_job_output(job_id: str) -> dict[str, str]:
     if rec.stream:
         _nonblocking_capture(rec)
 
-    running = rec.process.poll() is None
-    if not running and not rec.finished:
+    if not rec.finished and rec.process.poll() is not None:
         # Final capture
         _finalize_capture(rec)
 
+    stdout, stderr = _job_output_text(rec)
+    if rec.cached_status is not None:
+        return {
+            "status": "finished",
+            "stdout": stdout,
+            "stderr": stderr,
+            "exit_code": rec.cached_status["exit_code"],
+            "elapsed_seconds": rec.cached_status["elapsed_seconds"],
+        }
     return {
-        "status": "running" if running else "finished",
-        "stdout": "".join(rec.stdout_chunks),
-        "stderr": "".join(rec.stderr_chunks),
-        "exit_code": str(rec.process.returncode)
-        if rec.process.returncode is not None
-        else "None",
-        "elapsed_seconds": f"{time.time() - rec.start_time:.2f}",
+        "status": "running",
+        "stdout": stdout,
+        "stderr": stderr,
+        "exit_code": "None",
+        "elapsed_seconds": f"{time.monotonic() - rec.start_monotonic:.2f}",
     }
 
 
@@ -914,6 +1534,8 @@ def py_kill_job(job_id: str) -> dict[str, str]:
     """
     Terminate a running job. If already finished, returns status 'already-finished' without modifying output.
 
+    The job gets SIGTERM and, if it has not exited within KILL_GRACE_SECONDS, SIGKILL.
+
     Parameters:
         job_id: Job identifier.
     """
@@ -921,10 +1543,16 @@ def py_kill_job(job_id: str) -> dict[str, str]:
     if not rec:
         logger.warning("kill_job requested for missing job_id=%s", job_id)
         raise ValueError(f"No such job: {job_id}")
-    if rec.process.poll() is None:
+    if not rec.finished and rec.process.poll() is None:
         logger.info("Killing running job_id=%s pid=%s", job_id, rec.process.pid)
-        rec.process.kill()
-        time.sleep(0.05)
+        # SIGTERM first so the script can clean up; wait() returns as soon as the
+        # child is reaped and blocks the event loop for at most KILL_GRACE_SECONDS.
+        rec.process.terminate()
+        try:
+            rec.process.wait(timeout=KILL_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            rec.process.kill()
+            rec.process.wait()
         _finalize_capture(rec)
         status = "killed"
     else:
@@ -939,12 +1567,14 @@ def py_kill_job(job_id: str) -> dict[str, str]:
         rec.process.returncode,
         rec.finalized_elapsed
         if rec.finalized_elapsed is not None
-        else (time.time() - rec.start_time),
+        else (time.monotonic() - rec.start_monotonic),
     )
     return {
         "job_id": job_id,
         "status": status,
-        "exit_code": str(rec.process.returncode),
+        "exit_code": rec.cached_status["exit_code"]
+        if rec.cached_status is not None
+        else str(rec.process.returncode),
     }
 
 
@@ -971,34 +1601,132 @@ def py_cleanup_jobs(
         - Inline temp scripts are marked via JobRecord.is_inline_temp.
         - Safe to call repeatedly; missing files ignored.
     """
-    removed = 0
+    inline_paths: list[Path] = []
+    with _JOBS_LOCK:
+        removed_jids = [
+            jid for jid, rec in JOBS.items() if rec.finished or not only_finished
+        ]
+        for jid in removed_jids:
+            rec = JOBS.pop(jid)
+            if remove_inline and rec.is_inline_temp and rec.script_path is not None:
+                inline_paths.append(rec.script_path)
+        remaining = len(JOBS)
+
+    # Filesystem work happens outside the lock
     inline_deleted = 0
-    for jid in list(JOBS.keys()):
-        rec = JOBS[jid]
-        if only_finished and not rec.finished:
-            continue
-        if (
-            remove_inline
-            and rec.is_inline_temp
-            and rec.script_path
-            and rec.script_path.exists()
-        ):
-            try:
-                rec.script_path.unlink()
-                inline_deleted += 1
-            except Exception:
-                pass
-        del JOBS[jid]
-        removed += 1
+    for script_path in inline_paths:
+        try:
+            script_path.unlink()
+            inline_deleted += 1
+        except OSError:
+            pass
     return {
-        "removed": removed,
-        "remaining": len(JOBS),
+        "removed": len(removed_jids),
+        "remaining": remaining,
         "inline_deleted": inline_deleted,
     }
 
 
+@mcp.tool(tags=["jobs", "introspection"])
+def py_get_concurrency_status() -> dict[str, int]:
+    """
+    Report how many script runs are in progress against the MAX_CONCURRENT_RUNS limit
+    (set via PYTHON_MCP_MAX_CONCURRENCY). Runs beyond the limit are rejected.
+
+    Returns:
+        {
+          "max_concurrent_runs": int,
+          "active_runs": int,
+          "available": int
+        }
+    """
+    with _RUN_SLOTS_LOCK:
+        active = _active_runs
+    return {
+        "max_concurrent_runs": MAX_CONCURRENT_RUNS,
+        "active_runs": active,
+        "available": max(0, MAX_CONCURRENT_RUNS - active),
+    }
+
+
+def _measure_process(
+    proc: subprocess.Popen, sample_interval: float
+) -> tuple[Any, int, bytearray, bytearray]:
+    """
+    Collect a benchmarked child's output and peak RSS until it exits, then reap it.
+    Blocks the calling thread.
+
+    Returns:
+        (rusage from wait4, peak RSS in bytes sampled while running, stdout, stderr)
+    """
+    # Read RSS straight from /proc/<pid>/statm through one fd kept open for the
+    # whole run; psutil only where procfs is unavailable.
+    sample_errors: tuple[type[Exception], ...] = (OSError, IndexError, ValueError)
+    try:
+        statm_fd: int | None = os.open(f"/proc/{proc.pid}/statm", os.O_RDONLY)
+        ps_proc = None
+    except OSError:
+        import psutil  # Only needed without procfs; kept out of server startup
+
+        statm_fd = None
+        ps_proc = psutil.Process(proc.pid)
+        sample_errors += (psutil.Error,)
+    peak_rss = 0
+    stdout_buf = bytearray()
+    stderr_buf = bytearray()
+    buffers = {proc.stdout.fileno(): stdout_buf, proc.stderr.fileno(): stderr_buf}
+
+    # Block until output arrives or the child exits (pidfd becomes readable);
+    # RSS sampling runs off its own timer instead of a fixed sleep.
+    sel = selectors.DefaultSelector()
+    for fd in buffers:
+        os.set_blocking(fd, False)
+        sel.register(fd, selectors.EVENT_READ)
+    try:
+        pidfd: int | None = os.pidfd_open(proc.pid)
+        sel.register(pidfd, selectors.EVENT_READ)
+    except (AttributeError, OSError):
+        pidfd = None  # No pidfd support: poll for exit on each wakeup instead
+    rusage = None
+    try:
+        next_rss = time.monotonic()
+        while rusage is None:
+            now = time.monotonic()
+            if now >= next_rss:
+                try:
+                    if statm_fd is not None:
+                        statm = os.pread(statm_fd, 64, 0)
+                        rss = int(statm.split(None, 2)[1]) * _PAGE_SIZE
+                    else:
+                        rss = ps_proc.memory_info().rss
+                    peak_rss = max(peak_rss, rss)
+                except sample_errors:
+                    pass  # Exited between wakeups; wait4() reports the peak
+                next_rss = now + sample_interval
+            for key, _ in sel.select(timeout=max(0.0, next_rss - time.monotonic())):
+                if key.fd == pidfd:
+                    rusage = _reap_with_rusage(proc)
+                elif not _drain_fd(key.fd, buffers[key.fd]):
+                    sel.unregister(key.fd)
+            if pidfd is None:
+                rusage = _reap_with_rusage(proc, os.WNOHANG)
+        # Capture any trailing output
+        for fd, buf in buffers.items():
+            _drain_fd(fd, buf)
+    finally:
+        sel.close()
+        if pidfd is not None:
+            os.close(pidfd)
+        if statm_fd is not None:
+            os.close(statm_fd)
+        proc.stdout.close()
+        proc.stderr.close()
+    return rusage, peak_rss, stdout_buf, stderr_buf
+
+
 @mcp.tool(tags=["benchmark", "performance"])
 @smart_async(default_timeout=20.0)
+@_limit_concurrency
 async def py_benchmark_script(
     script_content: str | None = None,
     script_path: Path | None = None,
@@ -1036,26 +1764,16 @@ async def py_benchmark_script(
     if script_content and script_path:
         raise ValueError("Provide only one of 'script_content' or 'script_path'.")
     if script_path:
-        spath = Path(script_path).expanduser().resolve()
-        if not spath.is_file():
-            raise FileNotFoundError(f"Script not found: {spath}")
+        spath = _resolve_script(script_path)
         is_inline = False
     else:
-        inline_dir = Path.cwd() / "inline_scripts"
-        inline_dir.mkdir(parents=True, exist_ok=True)
-        spath = (inline_dir / f"inline_bench_{uuid.uuid4().hex}.py").resolve()
-        spath.write_text(script_content or "")
+        spath = _write_inline_script(script_content or "", prefix="inline_bench_")
         is_inline = True
     # Ensure Python version is installed
-    _ensure_python_version(python_version)
+    await asyncio.to_thread(_ensure_python_version, python_version)
 
-    command: list[str] = ["uv", "run", "--python", python_version]
     resolved_dependencies = dependencies[:] if dependencies else []
-    for dep in resolved_dependencies:
-        command += ["--with", dep]
-    command.append(str(spath))
-    if args:
-        command.extend(args)
+    _, command = _deps_command(spath, python_version, resolved_dependencies, args, None)
 
     # Build environment
     proc_env = _build_process_env(env_vars=env_vars, env_file=env_file)
@@ -1064,53 +1782,26 @@ async def py_benchmark_script(
         command,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
         env=proc_env,
     )
-    start_time = time.time()
-    ps_proc = psutil.Process(proc.pid)
-    peak_rss = 0
-    start_cpu = ps_proc.cpu_times()
-    stdout_chunks: list[str] = []
-    stderr_chunks: list[str] = []
-    while proc.poll() is None:
-        try:
-            rss = ps_proc.memory_info().rss
-            if rss > peak_rss:
-                peak_rss = rss
-        except psutil.Error:
-            break
-        # Non-blocking reads
-        if proc.stdout:
-            line = proc.stdout.readline()
-            while line:
-                stdout_chunks.append(line)
-                line = proc.stdout.readline()
-        if proc.stderr:
-            line = proc.stderr.readline()
-            while line:
-                stderr_chunks.append(line)
-                line = proc.stderr.readline()
-        time.sleep(sample_interval)
-    # Capture any trailing output
-    if proc.stdout:
-        for line in proc.stdout.readlines():
-            stdout_chunks.append(line)
-    if proc.stderr:
-        for line in proc.stderr.readlines():
-            stderr_chunks.append(line)
-    end_cpu = ps_proc.cpu_times()
-    wall = time.time() - start_time
-    cpu = (end_cpu.user - start_cpu.user) + (end_cpu.system - start_cpu.system)
-    if is_inline and spath.exists():
-        try:
-            spath.unlink()
-        except Exception:
-            pass
-    result = BenchmarkResult(
-        stdout="".join(stdout_chunks),
-        stderr="".join(stderr_chunks),
+    start_monotonic = time.monotonic()
+    # Waiting is blocking (selector + wait4), so it runs in a worker thread and the
+    # event loop, including the smart_async time budget, stays responsive.
+    try:
+        rusage, peak_rss, stdout_buf, stderr_buf = await asyncio.to_thread(
+            _measure_process, proc, sample_interval
+        )
+    finally:
+        if is_inline:
+            _release_inline_script(spath)
+    wall = time.monotonic() - start_monotonic
+    # wait4() accounts for the whole process tree (uv and the python it spawns)
+    cpu = rusage.ru_utime + rusage.ru_stime
+    maxrss_scale = 1 if sys.platform == "darwin" else 1024
+    peak_rss = max(peak_rss, rusage.ru_maxrss * maxrss_scale)
+    result = BenchmarkResult.model_construct(
+        stdout=_decode_output(stdout_buf),
+        stderr=_decode_output(stderr_buf),
         exit_code=proc.returncode,
         execution_strategy="uv-run",
         elapsed_seconds=wall,
@@ -1123,56 +1814,128 @@ async def py_benchmark_script(
     return result.model_dump()
 
 
-async def _poll_stream(job_id: str) -> None:
+def _register_job(rec: JobRecord) -> None:
     """
-    Background coroutine that periodically harvests stdout/stderr for a streaming job.
+    Add a job to the registry. Its pipes must be raw bytes (no text=True); they are
+    switched to non-blocking so _nonblocking_capture can drain them with os.read.
     """
-    rec = JOBS.get(job_id)
-    if not rec:
-        return
-    while rec.process.poll() is None:
-        _nonblocking_capture(rec)
-        await asyncio.sleep(STREAM_POLL_INTERVAL)
-    _finalize_capture(rec)
+    for pipe in (rec.process.stdout, rec.process.stderr):
+        if pipe:
+            os.set_blocking(pipe.fileno(), False)
+    with _JOBS_LOCK:
+        JOBS[rec.job_id] = rec
 
 
-def _nonblocking_capture(rec: JobRecord) -> None:
+def _capture_excess(buf: bytearray) -> int:
     """
-    Read available data without blocking and append to chunks.
+    Number of leading bytes to drop to keep buf within MAX_CAPTURE_BYTES, extended
+    past any UTF-8 continuation bytes so the kept output starts on a character.
     """
+    excess = len(buf) - MAX_CAPTURE_BYTES
+    if excess <= 0:
+        return 0
+    while excess < len(buf) and buf[excess] & 0xC0 == 0x80:
+        excess += 1
+    return excess
+
+
+def _capture_fd(rec: JobRecord, fd: int) -> bool:
+    """
+    Drain one of the job's pipes into its buffer, keeping the byte counters and
+    the MAX_CAPTURE_BYTES cap up to date.
+
+    Returns:
+        False once the pipe has reached EOF, True otherwise.
+    """
+    with _JOBS_LOCK:
+        if rec.process.stderr and fd == rec.process.stderr.fileno():
+            n = len(rec.stderr_buf)
+            is_open = _drain_fd(fd, rec.stderr_buf)
+            rec.stderr_len += len(rec.stderr_buf) - n
+            excess = _capture_excess(rec.stderr_buf)
+            if excess > 0:
+                del rec.stderr_buf[:excess]
+                rec.stderr_dropped += excess
+        else:
+            n = len(rec.stdout_buf)
+            is_open = _drain_fd(fd, rec.stdout_buf)
+            rec.stdout_len += len(rec.stdout_buf) - n
+            excess = _capture_excess(rec.stdout_buf)
+            if excess > 0:
+                del rec.stdout_buf[:excess]
+                rec.stdout_dropped += excess
+    return is_open
+
+
+def _nonblocking_capture(rec: JobRecord) -> bool:
+    """
+    Read available data without blocking and append to the byte buffers.
+
+    Returns:
+        True if any new output was read.
+    """
+    before = rec.stdout_len + rec.stderr_len
     proc = rec.process
     if proc.stdout:
-        while True:
-            line = proc.stdout.readline()
-            if not line:
-                break
-            rec.stdout_chunks.append(line)
+        _capture_fd(rec, proc.stdout.fileno())
     if proc.stderr:
-        while True:
-            line = proc.stderr.readline()
-            if not line:
-                break
-            rec.stderr_chunks.append(line)
+        _capture_fd(rec, proc.stderr.fileno())
+    return rec.stdout_len + rec.stderr_len != before
+
+
+def _job_output_text(rec: JobRecord) -> tuple[str, str]:
+    """
+    Return the job's captured (stdout, stderr) as text, decoding a stream only if
+    new bytes arrived since the last call.
+    """
+    if rec.stdout_text[0] != rec.stdout_len:
+        rec.stdout_text = (
+            rec.stdout_len,
+            _decode_output(rec.stdout_buf, final=rec.finished),
+        )
+    if rec.stderr_text[0] != rec.stderr_len:
+        rec.stderr_text = (
+            rec.stderr_len,
+            _decode_output(rec.stderr_buf, final=rec.finished),
+        )
+    return rec.stdout_text[1], rec.stderr_text[1]
 
 
 def _finalize_capture(rec: JobRecord) -> None:
     """
     Capture any remaining output and mark job finished. Freeze elapsed time.
     """
-    if rec.finished:
-        return
-    _nonblocking_capture(rec)
-    rec.exit_code = rec.process.returncode
-    rec.finished = True
-    rec.finalized_elapsed = time.time() - rec.start_time
-    logger.info(
-        "Job finalized job_id=%s exit_code=%s frozen_elapsed=%.2fs stdout_len=%d stderr_len=%d",
-        rec.job_id,
-        rec.exit_code,
-        rec.finalized_elapsed,
-        sum(len(c) for c in rec.stdout_chunks),
-        sum(len(c) for c in rec.stderr_chunks),
-    )
+    with _JOBS_LOCK:
+        if rec.finished:
+            return
+        _nonblocking_capture(rec)
+        rec.exit_code = rec.process.poll()
+        rec.finished = True
+        # Snapshots decoded while running may have held back a partial character
+        rec.stdout_text = rec.stderr_text = (-1, "")
+        rec.stream_text = (-1, -1, "")
+        rec.finalized_elapsed = time.monotonic() - rec.start_monotonic
+        logger.info(
+            "Job finalized job_id=%s exit_code=%s frozen_elapsed=%.2fs stdout_len=%d stderr_len=%d",
+            rec.job_id,
+            rec.exit_code,
+            rec.finalized_elapsed,
+            rec.stdout_len,
+            rec.stderr_len,
+        )
+        # Nothing in the listing entry changes after this point; build it once.
+        rec.cached_status = {
+            "job_id": rec.job_id,
+            "running": "False",
+            "exit_code": str(rec.exit_code),
+            "pid": str(rec.process.pid),
+            "elapsed_seconds": f"{rec.finalized_elapsed:.2f}",
+            "stream": str(rec.stream),
+            "stdout_bytes": str(rec.stdout_len),
+            "stderr_bytes": str(rec.stderr_len),
+            "stdout_dropped": str(rec.stdout_dropped),
+            "stderr_dropped": str(rec.stderr_dropped),
+        }
 
 
 @mcp.resource("job-stream://{job_id}")
@@ -1197,16 +1960,20 @@ def get_job_output_stream(job_id: str) -> str:
     rec = JOBS.get(job_id)
     if not rec:
         return f"[error] job not found: {job_id}"
+    if rec.process.stdout is None and rec.process.stderr is None:
+        return "[output not captured]"
     if rec.stream:
         _nonblocking_capture(rec)
 
     # Do not finalize capture here; allow caller to decide lifecycle.
-    return (
-        "---STDOUT---\n"
-        + "".join(rec.stdout_chunks)
-        + "\n---STDERR---\n"
-        + "".join(rec.stderr_chunks)
-    )
+    if rec.stream_text[:2] != (rec.stdout_len, rec.stderr_len):
+        stdout, stderr = _job_output_text(rec)
+        rec.stream_text = (
+            rec.stdout_len,
+            rec.stderr_len,
+            f"{_STREAM_HDR}{stdout}{_STREAM_MID}{stderr}",
+        )
+    return rec.stream_text[2]
 
 
 def main() -> None:
@@ -1222,69 +1989,76 @@ def main() -> None:
         cwd,
         py_exec,
         py_version,
-        shutil.which("uv") is not None,
+        _UV_PATH is not None,
     )
     # List key environment variables that might affect execution
-    interesting_env = {
-        k: v for k, v in os.environ.items() if k.startswith(("PYTHON", "UV", "FASTMCP"))
-    }
-    if interesting_env:
-        logger.info("Environment (filtered): %s", interesting_env)
-    else:
-        logger.info("No filtered environment variables detected.")
+    if logger.isEnabledFor(logging.INFO):
+        interesting_env = {
+            k: v for k, v in os.environ.items() if k.startswith(_ENV_PREFIXES)
+        }
+        if interesting_env:
+            logger.info("Environment (filtered): %s", interesting_env)
+        else:
+            logger.info("No filtered environment variables detected.")
 
     # Initialize smart async state
     initialize_state()
     logger.info("Smart async job tracking initialized")
 
-    # Global exception hook: capture uncaught exceptions to a file for post-mortem
-    def _write_exception(exc_type, exc_value, exc_tb):
+    # Crash diagnostics go to one line-buffered file opened once, so a burst of
+    # exceptions costs a write each rather than an open/close each.
+    with ExitStack() as stack:
         try:
-            import traceback
+            crash_log = stack.enter_context(
+                open(
+                    os.path.join(
+                        os.getenv("PYTHON_MCP_LOG_DIR", "/tmp"),
+                        "python_mcp_uncaught.log",
+                    ),
+                    "a",
+                    encoding="utf-8",
+                    buffering=1,
+                )
+            )
+        except OSError:
+            crash_log = sys.stderr  # stdout carries the MCP protocol; stderr is safe
 
-            path = Path("/tmp/python_mcp_uncaught.log")
-            with path.open("a", encoding="utf-8") as f:
-                f.write("\n=== Uncaught exception ===\n")
-                traceback.print_exception(exc_type, exc_value, exc_tb, file=f)
-        except Exception:
-            # Best-effort only; avoid raising in excepthook
-            pass
+        # Global exception hook: capture uncaught exceptions to a file for post-mortem
+        def _write_exception(exc_type, exc_value, exc_tb):
+            try:
+                crash_log.write("\n=== Uncaught exception ===\n")
+                traceback.print_exception(exc_type, exc_value, exc_tb, file=crash_log)
+            except Exception:
+                # Best-effort only; avoid raising in excepthook
+                pass
 
-    sys.excepthook = _write_exception
+        sys.excepthook = _write_exception
 
-    # Asyncio exception handler: capture loop exceptions
-    def _asyncio_exc_handler(loop, context):
-        try:
-            path = Path("/tmp/python_mcp_async_exc.log")
-            with path.open("a", encoding="utf-8") as f:
-                f.write("\n=== Asyncio exception ===\n")
-                f.write(str(context))
-                f.write("\n")
-        except Exception:
-            pass
+        # Asyncio exception handler: capture loop exceptions
+        def _asyncio_exc_handler(loop, context):
+            try:
+                crash_log.write("\n=== Asyncio exception ===\n")
+                crash_log.write(str(context))
+                crash_log.write("\n")
+            except Exception:
+                pass
 
-    try:
-        loop = asyncio.get_event_loop()
-        loop.set_exception_handler(_asyncio_exc_handler)
-    except Exception:
-        # If event loop not available at startup, ignore
-        pass
+        async def _serve() -> None:
+            # Install the handler on the loop the server actually runs on
+            asyncio.get_running_loop().set_exception_handler(_asyncio_exc_handler)
+            await mcp.run_async(transport="stdio")
 
-    # Run the MCP server and capture top-level exceptions to a file as well
-    try:
-        mcp.run(transport="stdio")
-    except Exception:
+        # Run the MCP server and capture top-level exceptions to a file as well
         try:
-            import traceback
-
-            path = Path("/tmp/python_mcp_run_exception.log")
-            with path.open("a", encoding="utf-8") as f:
-                f.write("\n=== MCP server top-level exception ===\n")
-                traceback.print_exc(file=f)
+            asyncio.run(_serve())
         except Exception:
-            pass
-        # Re-raise after logging so any supervising process can act accordingly
-        raise
+            try:
+                crash_log.write("\n=== MCP server top-level exception ===\n")
+                traceback.print_exc(file=crash_log)
+            except Exception:
+                pass
+            # Re-raise after logging so any supervising process can act accordingly
+            raise
 
 
 @mcp.tool(tags=["scripts", "save"])
@@ -1309,7 +2083,7 @@ def py_save_script(
         # requires-python = ">=3.12"
         # ///
     """
-    scripts_dir = Path.cwd() / "scripts"
+    scripts_dir = _scripts_dir()
     scripts_dir.mkdir(parents=True, exist_ok=True)
 
     # Prevent path traversal; ensure .py suffix.
@@ -1346,6 +2120,7 @@ def py_save_script(
 
 @mcp.tool(tags=["scripts", "run"])
 @smart_async(default_timeout=20.0)
+@_limit_concurrency
 async def py_run_saved_script(
     script_name: str,
     args: list[str] | None = None,
@@ -1371,7 +2146,7 @@ async def py_run_saved_script(
         job_label: Optional label for job tracking.
         auto_install_deps: If True, auto-detect and install missing dependencies (default: True).
     """
-    scripts_dir = Path.cwd() / "scripts"
+    scripts_dir = _scripts_dir()
     name = Path(script_name).name
     spath = scripts_dir / (name if name.endswith(".py") else f"{name}.py")
     if not spath.is_file():
@@ -1380,7 +2155,9 @@ async def py_run_saved_script(
     # Auto-detect dependencies if enabled and no header exists
     detected_deps: list[str] = []
     if auto_install_deps:
-        source_text = spath.read_text()
+        # Imports live near the top; a bounded prefix is enough for detection
+        with spath.open("rb") as f:
+            source_text = f.read(_IMPORT_SCAN_BYTES).decode("utf-8", "replace")
         # Check if script has TOML header
         if not source_text.startswith("# /// script"):
             detected_deps = _parse_imports(source_text)
@@ -1389,15 +2166,14 @@ async def py_run_saved_script(
                     f"Auto-detected dependencies for {script_name}: {detected_deps}"
                 )
 
-    command: list[str] = ["uv", "run"]
+    command: list[str] = [_UV, "run"]
 
     # If auto-detected deps, use isolated mode to avoid pyproject.toml conflicts
     if detected_deps:
         command.append("--isolated")
 
     # Add auto-detected dependencies
-    for dep in detected_deps:
-        command += ["--with", dep]
+    command += _with_flags(detected_deps)
 
     command += ["--script", str(spath)]
     if args:
@@ -1406,7 +2182,7 @@ async def py_run_saved_script(
     # Build environment
     proc_env = _build_process_env(env_vars=env_vars, env_file=env_file)
 
-    start = time.time()
+    start = time.monotonic()
     proc = await asyncio.create_subprocess_exec(
         *command,
         cwd=str(scripts_dir),
@@ -1414,91 +2190,147 @@ async def py_run_saved_script(
         stderr=asyncio.subprocess.PIPE,
         env=proc_env,
     )
+    stdout_buf = bytearray()
+    stderr_buf = bytearray()
     try:
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(
-            proc.communicate(),
+        # wait_for cancels the readers on timeout before the kill below
+        await asyncio.wait_for(
+            asyncio.gather(
+                _read_stream(proc.stdout, stdout_buf),
+                _read_stream(proc.stderr, stderr_buf),
+                proc.wait(),
+            ),
             timeout=None if timeout_seconds == 0 else timeout_seconds,
         )
-        stdout = stdout_bytes.decode("utf-8")
-        stderr = stderr_bytes.decode("utf-8")
-    except asyncio.TimeoutError:
+        stdout = _decode_output(stdout_buf)
+        stderr = _decode_output(stderr_buf)
+    except TimeoutError:
         proc.kill()
         await proc.wait()
         stdout = ""
         stderr = "[TIMEOUT]"
     except Exception as e:
         raise RuntimeError(f"Execution failed: {e}")  # noqa: TRY003
-    result = RunScriptResult(
+    result = RunScriptResult.model_construct(
         stdout=stdout,
         stderr=stderr,
         exit_code=proc.returncode or 0,
         execution_strategy="uv-run",
-        elapsed_seconds=time.time() - start,
+        elapsed_seconds=time.monotonic() - start,
     )
     return result.model_dump()
 
 
+# Script header/docstring previews keyed by path: (mtime_ns, size, doc, header_meta)
+_SCRIPT_META_CACHE: dict[str, tuple[int, int, str, dict[str, str]]] = {}
+# Docstring and uv script header live at the top of the file; read only this much
+# unless one of them turns out to extend past it.
+_SCRIPT_HEAD_BYTES = 4096
+
+
+def _parse_script_head(text: str) -> tuple[str, dict[str, str], bool]:
+    """
+    Extract the top docstring and uv script header metadata from script text.
+
+    Returns:
+        (docstring, header_meta, complete) where complete is False if a docstring or
+        header block is opened but not closed within text.
+    """
+    complete = True
+
+    # Extract top docstring preview (first triple-quoted block at file start).
+    doc = ""
+    t = text.lstrip()
+    if t.startswith('"""') or t.startswith("'''"):
+        q = t[:3]
+        end = t.find(q, 3)
+        if end != -1:
+            doc = t[3:end].strip()
+        else:
+            complete = False
+
+    # Extract uv script header metadata
+    header_meta: dict[str, str] = {}
+    lines = text.splitlines()
+    start_idx: int | None = None
+    end_idx: int | None = None
+    for i, line in enumerate(lines):
+        if line.startswith("# /// script"):
+            start_idx = i
+            break
+    if start_idx is not None:
+        for j in range(start_idx + 1, len(lines)):
+            if lines[j].startswith("# ///"):
+                end_idx = j
+                break
+        if end_idx is None:
+            complete = False
+        body_lines: list[str] = []
+        for k in range(start_idx + 1, (end_idx or start_idx + 1)):
+            line = lines[k]
+            if line.startswith("#"):
+                body_lines.append(line.lstrip("# ").rstrip())
+        toml_text = "\n".join(body_lines)
+        if toml_text:
+            try:
+                data = tomllib.loads(toml_text)
+                if "requires-python" in data:
+                    header_meta["requires-python"] = str(data.get("requires-python"))
+                if "dependencies" in data:
+                    deps = data.get("dependencies") or []
+                    header_meta["dependencies"] = ", ".join(deps)
+            except Exception:
+                header_meta["parse_error"] = "true"
+    return doc, header_meta, complete
+
+
+def _read_script_meta(path: str) -> tuple[str, dict[str, str]]:
+    """
+    Read a script's docstring preview and header metadata from its first bytes,
+    falling back to the whole file only when a block is cut off.
+    """
+    with open(path, "rb") as f:
+        raw = f.read(_SCRIPT_HEAD_BYTES)
+        doc, header_meta, complete = _parse_script_head(
+            raw.decode("utf-8", errors="replace")
+        )
+        if not complete and len(raw) == _SCRIPT_HEAD_BYTES:
+            raw += f.read()
+            doc, header_meta, _ = _parse_script_head(
+                raw.decode("utf-8", errors="replace")
+            )
+    return doc, header_meta
+
+
 @mcp.tool(tags=["scripts", "introspection"])
 def py_list_scripts() -> list[dict[str, str]]:
     """
     List scripts in 'scripts/' and show their name, path, top docstring preview, and script header metadata.
     """
-    scripts_dir = Path.cwd() / "scripts"
+    try:
+        # scandir entries carry the file type, and cache their stat() result
+        with os.scandir(_scripts_dir()) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith(".py") and e.is_file()),
+                key=lambda e: e.name,
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
     out: list[dict[str, str]] = []
-    if not scripts_dir.is_dir():
-        return out
-
-    for p in sorted(scripts_dir.glob("*.py")):
-        text = p.read_text(encoding="utf-8", errors="replace")
-
-        # Extract top docstring preview (first triple-quoted block at file start).
-        doc = ""
-        t = text.lstrip()
-        if t.startswith('"""') or t.startswith("'''"):
-            q = t[:3]
-            end = t.find(q, 3)
-            if end != -1:
-                doc = t[3:end].strip()
-
-        # Extract uv script header metadata
-        header_meta: dict[str, str] = {}
-        lines = text.splitlines()
-        start_idx: int | None = None
-        end_idx: int | None = None
-        for i, line in enumerate(lines):
-            if line.startswith("# /// script"):
-                start_idx = i
-                break
-        if start_idx is not None:
-            for j in range(start_idx + 1, len(lines)):
-                if lines[j].startswith("# ///"):
-                    end_idx = j
-                    break
-            body_lines: list[str] = []
-            for k in range(start_idx + 1, (end_idx or start_idx + 1)):
-                line = lines[k]
-                if line.startswith("#"):
-                    body_lines.append(line.lstrip("# ").rstrip())
-            toml_text = "\n".join(body_lines)
-            if toml_text:
-                try:
-                    import tomllib
-
-                    data = tomllib.loads(toml_text)
-                    if "requires-python" in data:
-                        header_meta["requires-python"] = str(
-                            data.get("requires-python")
-                        )
-                    if "dependencies" in data:
-                        deps = data.get("dependencies") or []
-                        header_meta["dependencies"] = ", ".join(deps)
-                except Exception:
-                    header_meta["parse_error"] = "true"
+    for e in entries:
+        st = e.stat()
+        cached = _SCRIPT_META_CACHE.get(e.path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            doc, header_meta = cached[2], cached[3]
+        else:
+            doc, header_meta = _read_script_meta(e.path)
+            _SCRIPT_META_CACHE[e.path] = (st.st_mtime_ns, st.st_size, doc, header_meta)
 
         out.append(
             {
-                "name": p.name,
-                "path": str(p),
+                "name": e.name,
+                "path": e.path,
                 "docstring": doc[:300],
                 "header": "; ".join(f"{k}={v}" for k, v in header_meta.items())
                 if header_meta
@@ -1532,6 +2364,22 @@ def py_job_status(job_id: str, incremental: bool = True) -> dict[str, Any]:
     return get_job_status(job_id, incremental=incremental)
 
 
+@mcp.tool(tags=["jobs", "async"])
+def py_jobs_status(job_ids: list[str], incremental: bool = True) -> dict[str, Any]:
+    """
+    Get status and progress of several background jobs in one call.
+
+    Args:
+        job_ids: Job identifiers returned from async execution
+        incremental: If True, return only new output since last check (default: True, set False for full output)
+
+    Returns:
+        {"jobs": {job_id: status}}, each status as returned by py_job_status
+        (or an error for an unknown job_id)
+    """
+    return get_jobs_status(job_ids, incremental=incremental)
+
+
 @mcp.tool(tags=["jobs", "async"])
 def py_list_jobs(status_filter: str | None = None, limit: int = 50) -> dict[str, Any]:
     """
@@ -14,11 +14,13 @@ Based on the production-tested pattern from the mcp-builder skill.
 from __future__ import annotations
 
 import asyncio
+import atexit
 import contextvars
+import heapq
+import itertools
 import json
 import logging
 import os
-import uuid
 from collections.abc import Awaitable, Callable
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
@@ -27,13 +29,23 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Job ids are a per-process random tag plus a counter: unique across restarts sharing
+# the persisted registry without building a UUID per job.
+_PROC_TAG = os.urandom(4).hex()
+_JOB_COUNTER = itertools.count()
+
+
+def _new_job_id() -> str:
+    return f"{_PROC_TAG}-{next(_JOB_COUNTER):x}"
+
+
 # Context variable to track current job_id in async tasks (for progress tracking)
 current_job_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "current_job_id", default=None
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class JobMeta:
     """Metadata for async background jobs with progress tracking."""
 
@@ -80,13 +92,55 @@ def initialize_state(persistence_dir: Path | None = None) -> None:
     _load_jobs()
 
 
-def _save_jobs() -> None:
-    """Persist jobs to disk."""
-    jobs_path = STATE.persistence_dir / "meta" / "jobs.json"
-    jobs_path.parent.mkdir(parents=True, exist_ok=True)
+# Progress and streamed output can touch a job many times a second; those saves are
+# coalesced into one write per SAVE_DEBOUNCE_SECONDS. Status transitions save at once.
+SAVE_DEBOUNCE_SECONDS = 0.25
+_pending_save: tuple[asyncio.AbstractEventLoop, asyncio.TimerHandle] | None = None
+
+
+def _schedule_save() -> None:
+    """Persist jobs soon, folding further calls into the same write."""
+    global _pending_save
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _save_jobs()
+        return
+    if _pending_save is not None and _pending_save[0] is loop:
+        return
+    _pending_save = (loop, loop.call_later(SAVE_DEBOUNCE_SECONDS, _save_jobs))
+
+
+def _flush_pending_save() -> None:
+    """Write out a debounced save that has not fired yet."""
+    if _pending_save is not None:
+        _save_jobs()
+
+
+atexit.register(_flush_pending_save)
 
+
+# (inode, mtime, size) of jobs.json as this process last read or wrote it; every save
+# replaces the file, so a refresh can skip re-parsing while the stamp is unchanged
+_disk_stamp: tuple[int, int, int] | None = None
+
+
+def _file_stamp(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+_FINISHED_STATUSES = frozenset({"completed", "failed", "cancelled"})
+# Serialized form of finished jobs by id: they no longer change, so saves reuse it
+_encoded_finished: dict[str, str] = {}
+
+
+def _encode_job(j: JobMeta) -> str:
     # Filter out task references (not serializable)
-    serializable = [
+    return json.dumps(
         {
             "id": j.id,
             "label": j.label,
@@ -100,17 +154,44 @@ def _save_jobs() -> None:
             "partial_stdout": j.partial_stdout if j.status == "running" else "",
             "partial_stderr": j.partial_stderr if j.status == "running" else "",
         }
-        for j in STATE.jobs.values()
-    ]
+    )
+
 
-    jobs_path.write_text(json.dumps(serializable, indent=2))
-    logger.debug(f"Saved {len(serializable)} jobs to {jobs_path}")
+def _save_jobs() -> None:
+    """Persist jobs to disk."""
+    global _pending_save, _disk_stamp
+    if _pending_save is not None:
+        _pending_save[1].cancel()
+        _pending_save = None
+
+    jobs_path = STATE.persistence_dir / "meta" / "jobs.json"
+    jobs_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # One compact JSON object per line; finished jobs are encoded once and reused
+    parts = []
+    for j in STATE.jobs.values():
+        encoded = _encoded_finished.get(j.id)
+        if encoded is None:
+            encoded = _encode_job(j)
+            if j.status in _FINISHED_STATUSES and (j.task is None or j.task.done()):
+                _encoded_finished[j.id] = encoded
+        parts.append(encoded)
+
+    # Write then rename so readers in other processes never see a half-written file
+    tmp_path = jobs_path.with_name(f"{jobs_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text("[\n" + ",\n".join(parts) + "\n]\n")
+    stamp = _file_stamp(tmp_path)
+    os.replace(tmp_path, jobs_path)
+    _disk_stamp = stamp
+    logger.debug(f"Saved {len(parts)} jobs to {jobs_path}")
 
 
 def _load_jobs() -> None:
     """Load jobs from disk on startup."""
+    global _disk_stamp
     jobs_path = STATE.persistence_dir / "meta" / "jobs.json"
-    if not jobs_path.exists():
+    _disk_stamp = _file_stamp(jobs_path)
+    if _disk_stamp is None:
         return
 
     try:
@@ -141,17 +222,25 @@ def _refresh_jobs_from_disk() -> None:
     This ensures that jobs created in subprocesses (e.g., via py_run_script_*)
     are visible in the main MCP server process.
 
-    Always syncs the latest state from disk to ensure cross-process consistency.
+    Jobs with a task in this process are left alone: the in-memory object is the
+    one their coroutine updates, and it may be ahead of a debounced save. The file
+    is only parsed when it changed since this process last read or wrote it.
     """
+    global _disk_stamp
     jobs_path = STATE.persistence_dir / "meta" / "jobs.json"
-    if not jobs_path.exists():
+    stamp = _file_stamp(jobs_path)
+    if stamp is None or stamp == _disk_stamp:
         return
+    _disk_stamp = stamp
 
     try:
         data = json.loads(jobs_path.read_text())
         for job_data in data:
             job_id = job_data["id"]
-            # Always update from disk to get latest state (handles status changes, completions, etc.)
+            local = STATE.jobs.get(job_id)
+            if local is not None and local.task is not None:
+                continue
+            # Update from disk to get latest state (handles status changes, completions, etc.)
             STATE.jobs[job_id] = JobMeta(**job_data)
         logger.debug(f"Refreshed {len(data)} jobs from disk")
     except Exception as e:
@@ -178,7 +267,7 @@ def _update_job_progress(
     if message:
         job.progress["message"] = message
 
-    _save_jobs()
+    _schedule_save()
 
 
 def _job_public(job: JobMeta, include_partial: bool = True) -> dict[str, Any]:
@@ -225,7 +314,7 @@ def _launch_background_job(
     Returns:
         Job metadata with job_id and status
     """
-    job_id = str(uuid.uuid4())
+    job_id = _new_job_id()
     job = JobMeta(
         id=job_id,
         label=label,
@@ -277,8 +366,8 @@ async def _run_with_time_budget(
     """
     Run a coroutine with a time budget. If it exceeds the budget, launch as background job.
 
-    The task is shielded to prevent cancellation when switching to background mode,
-    ensuring the work continues even after the timeout.
+    The task is not cancelled when switching to background mode, ensuring the work
+    continues even after the timeout.
 
     Args:
         label: Human-readable label for the operation
@@ -290,57 +379,52 @@ async def _run_with_time_budget(
     """
     coro = coro_factory()
     task = asyncio.create_task(coro)
-    shielded = asyncio.shield(task)
 
-    try:
-        return await asyncio.wait_for(shielded, timeout=timeout_seconds)
-    except asyncio.TimeoutError:
-        logger.info(
-            f"Task '{label}' exceeded {timeout_seconds}s budget, switching to background"
-        )
-        # Task continues running; wrap it in a job
-        job_id = str(uuid.uuid4())
-        job = JobMeta(
-            id=job_id,
-            label=label,
-            status="running",
-            created_at=datetime.now().isoformat(),
-            started_at=datetime.now().isoformat(),
-        )
-        STATE.jobs[job_id] = job
-        job.task = task
-
-        async def _finalize():
-            try:
-                result = await task
-                job.status = "completed"
-                job.result = result
-                job.completed_at = datetime.now().isoformat()
+    # asyncio.wait never cancels the task on timeout, so no shield is needed
+    done, _ = await asyncio.wait((task,), timeout=timeout_seconds)
+    if done:
+        return task.result()
 
-                # Store final output from result if it's a dict with stdout/stderr
-                if isinstance(result, dict):
-                    if "stdout" in result:
-                        job.partial_stdout = result.get("stdout", "")
-                    if "stderr" in result:
-                        job.partial_stderr = result.get("stderr", "")
+    logger.info(
+        f"Task '{label}' exceeded {timeout_seconds}s budget, switching to background"
+    )
+    # Task continues running; wrap it in a job
+    job_id = _new_job_id()
+    now = datetime.now().isoformat()
+    job = JobMeta(
+        id=job_id,
+        label=label,
+        status="running",
+        created_at=now,
+        started_at=now,
+    )
+    STATE.jobs[job_id] = job
+    job.task = task
 
-                # Clear partial output on completion
+    def _finalize(t: asyncio.Task) -> None:
+        # A cancelled task keeps the status and completion time set by cancel_job
+        if not t.cancelled():
+            exc = t.exception()
+            if exc is None:
+                job.status = "completed"
+                job.result = t.result()
+                # Clear partial output on completion (result has full output)
                 job.partial_stdout = ""
                 job.partial_stderr = ""
-            except Exception as e:
+            else:
                 job.status = "failed"
-                job.error = str(e)
-                job.completed_at = datetime.now().isoformat()
-                logger.exception(f"Background job {job_id} ({label}) failed")
-            finally:
-                _save_jobs()
+                job.error = str(exc)
+                logger.error(f"Background job {job_id} ({label}) failed", exc_info=exc)
+            job.completed_at = datetime.now().isoformat()
+        _save_jobs()
 
-        asyncio.create_task(_finalize())
-        return {
-            "job_id": job_id,
-            "status": "running",
-            "message": f"Task exceeded {timeout_seconds}s time budget; running in background",
-        }
+    # Record the outcome from the task itself rather than a second task awaiting it
+    task.add_done_callback(_finalize)
+    return {
+        "job_id": job_id,
+        "status": "running",
+        "message": f"Task exceeded {timeout_seconds}s time budget; running in background",
+    }
 
 
 def smart_async(
@@ -376,6 +460,9 @@ def smart_async(
     import functools
 
     def _decorator(func):
+        # Last seen value of timeout_env and its parsed timeout; re-parsed on change
+        timeout_cache: list[Any] = [None, default_timeout]
+
         @functools.wraps(func)
         async def _wrapper(*args, **kwargs):
             # Extract control parameters
@@ -383,10 +470,14 @@ def smart_async(
             job_label = kwargs.pop("job_label", None)
 
             label = job_label or func.__name__
-            try:
-                timeout_seconds = float(os.getenv(timeout_env, str(default_timeout)))
-            except Exception:
-                timeout_seconds = default_timeout
+            raw_timeout = os.environ.get(timeout_env)
+            if raw_timeout != timeout_cache[0]:
+                try:
+                    timeout_cache[1] = float(raw_timeout)
+                except Exception:
+                    timeout_cache[1] = default_timeout
+                timeout_cache[0] = raw_timeout
+            timeout_seconds = timeout_cache[1]
 
             if async_mode:
                 return _launch_background_job(
@@ -417,7 +508,25 @@ def get_job_status(job_id: str, incremental: bool = False) -> dict[str, Any]:
     """
     # Refresh from disk to get jobs from other processes
     _refresh_jobs_from_disk()
+    return _job_status(job_id, incremental)
+
+
+def get_jobs_status(job_ids: list[str], incremental: bool = False) -> dict[str, Any]:
+    """
+    Get status of several background jobs with a single registry refresh.
+
+    Args:
+        job_ids: Job identifiers
+        incremental: If True, return only new output since last check
+
+    Returns:
+        {"jobs": {job_id: <get_job_status response>}} in the order given
+    """
+    _refresh_jobs_from_disk()
+    return {"jobs": {job_id: _job_status(job_id, incremental) for job_id in job_ids}}
 
+
+def _job_status(job_id: str, incremental: bool) -> dict[str, Any]:
     job = STATE.jobs.get(job_id)
     if not job:
         return {"error": f"Job {job_id} not found"}
@@ -441,6 +550,27 @@ def get_job_status(job_id: str, incremental: bool = False) -> dict[str, Any]:
     return response
 
 
+async def wait_for_job(job_id: str, timeout: float | None = None) -> dict[str, Any]:
+    """
+    Wait for a job to finish, then return its status.
+
+    Only jobs running in this process can be awaited; for others the current
+    status is returned right away.
+
+    Args:
+        job_id: Job identifier
+        timeout: Maximum seconds to wait (None waits until the job finishes)
+
+    Returns:
+        Job status as returned by get_job_status
+    """
+    job = STATE.jobs.get(job_id)
+    if job is not None and job.task is not None and not job.task.done():
+        # Outcome callbacks on the task run before this waiter resumes
+        await asyncio.wait((job.task,), timeout=timeout)
+    return get_job_status(job_id)
+
+
 def list_jobs(status_filter: str | None = None, limit: int = 50) -> dict[str, Any]:
     """
     List all jobs with optional status filtering.
@@ -455,16 +585,13 @@ def list_jobs(status_filter: str | None = None, limit: int = 50) -> dict[str, An
     # Refresh from disk to get jobs from other processes
     _refresh_jobs_from_disk()
 
-    jobs = list(STATE.jobs.values())
+    jobs = STATE.jobs.values()
 
     if status_filter:
-        jobs = [j for j in jobs if j.status == status_filter]
+        jobs = (j for j in jobs if j.status == status_filter)
 
-    # Sort by created_at descending (newest first)
-    jobs.sort(key=lambda j: j.created_at or "", reverse=True)
-
-    # Apply limit
-    jobs = jobs[:limit]
+    # Newest first; only the 'limit' newest are ordered, not the whole registry
+    jobs = heapq.nlargest(limit, jobs, key=lambda j: j.created_at or "")
 
     return {"jobs": [_job_public(j) for j in jobs], "total": len(jobs)}
 
@@ -527,8 +654,21 @@ def prune_jobs(
     cutoff = now - timedelta(hours=max_age_hours)
     removed = 0
 
+    # Check status filters first: only these statuses can be removed, and with
+    # both kept there is nothing to scan or parse
+    prunable = set()
+    if not keep_completed:
+        prunable.add("completed")
+    if not keep_failed:
+        prunable.add("failed")
+    if not prunable:
+        return {"removed": 0, "remaining": len(STATE.jobs)}
+
     jobs_to_remove = []
     for job_id, job in STATE.jobs.items():
+        if job.status not in prunable:
+            continue
+
         # Parse created_at
         try:
             created_at = datetime.fromisoformat(job.created_at)
@@ -537,14 +677,11 @@ def prune_jobs(
 
         # Check age
         if created_at < cutoff:
-            # Check status filters
-            if job.status == "completed" and not keep_completed:
-                jobs_to_remove.append(job_id)
-            elif job.status == "failed" and not keep_failed:
-                jobs_to_remove.append(job_id)
+            jobs_to_remove.append(job_id)
 
     for job_id in jobs_to_remove:
         del STATE.jobs[job_id]
+        _encoded_finished.pop(job_id, None)
         removed += 1
 
     if removed > 0:
@@ -605,7 +742,7 @@ def update_job_output(job_id: str, stdout: str = "", stderr: str = "") -> None:
     if stderr:
         job.partial_stderr += stderr
 
-    _save_jobs()
+    _schedule_save()
 
 
 def create_output_callback() -> Callable[[str, str], None]:
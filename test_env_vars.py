@@ -11,12 +11,14 @@ This script tests:
 import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from python_mcp_server import (
+    MAX_CONCURRENT_RUNS,
     _build_process_env,
     _exec_with_dependencies_sync,
     _load_env_file,
@@ -139,55 +141,51 @@ print(f"FROM_FILE={os.getenv('FROM_FILE', 'NOT_SET')}")
         f.write(env_content)
         env_file = Path(f.name)
 
-    try:
-        # Test with env_vars dict
-        print("Running with env_vars dict...")
-        result1 = _exec_with_dependencies_sync(
+    def run(**env_kwargs):
+        return _exec_with_dependencies_sync(
             script_content=test_script,
             script_path=None,
             python_version="3.13",
             dependencies=[],
             args=None,
             timeout_seconds=300,
-            env_vars={"CUSTOM_VAR": "hello", "ANOTHER_VAR": "world"},
+            **env_kwargs,
         )
 
+    try:
+        # The three runs are independent and subprocess-bound: run them side by
+        # side, within the server's limit on concurrent runs
+        with ThreadPoolExecutor(max_workers=min(3, MAX_CONCURRENT_RUNS)) as pool:
+            # Test with env_vars dict
+            future1 = pool.submit(
+                run, env_vars={"CUSTOM_VAR": "hello", "ANOTHER_VAR": "world"}
+            )
+            # Test with env_file
+            future2 = pool.submit(run, env_file=env_file)
+            # Test with both (dict should override file)
+            future3 = pool.submit(
+                run,
+                env_file=env_file,
+                env_vars={"CUSTOM_VAR": "override", "FROM_FILE": "overridden"},
+            )
+
+        print("Running with env_vars dict...")
+        result1 = future1.result()
         print("Output:")
         print(result1.stdout)
         assert "CUSTOM_VAR=hello" in result1.stdout
         assert "ANOTHER_VAR=world" in result1.stdout
         assert result1.exit_code == 0
 
-        # Test with env_file
         print("Running with env_file...")
-        result2 = _exec_with_dependencies_sync(
-            script_content=test_script,
-            script_path=None,
-            python_version="3.13",
-            dependencies=[],
-            args=None,
-            timeout_seconds=300,
-            env_file=env_file,
-        )
-
+        result2 = future2.result()
         print("Output:")
         print(result2.stdout)
         assert "FROM_FILE=loaded_from_env_file" in result2.stdout
         assert result2.exit_code == 0
 
-        # Test with both (dict should override file)
         print("Running with both env_file and env_vars...")
-        result3 = _exec_with_dependencies_sync(
-            script_content=test_script,
-            script_path=None,
-            python_version="3.13",
-            dependencies=[],
-            args=None,
-            timeout_seconds=300,
-            env_file=env_file,
-            env_vars={"CUSTOM_VAR": "override", "FROM_FILE": "overridden"},
-        )
-
+        result3 = future3.result()
         print("Output:")
         print(result3.stdout)
         assert "CUSTOM_VAR=override" in result3.stdout
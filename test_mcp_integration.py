@@ -18,7 +18,6 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from python_mcp_server.smart_async import (
-    STATE,
     cancel_job,
     create_progress_callback,
     get_job_status,
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Tests for the script runner tools of python-mcp-server.
+
+This script tests:
+1. PEP 723 '# /// script' headers are honoured by isolated dependency runs
+2. The same for the blocking runner used outside the event loop
+3. Dependency venv cache hits, rebuilds and evictions
+4. The concurrent run limit: rejection, release on error/timeout, background jobs
+5. combine_streams interleaves stderr into stdout
+6. capture_output=False discards output but keeps the exit code and timeout
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from python_mcp_server import (
+    _exec_with_dependencies_sync,
+    py_get_concurrency_status,
+    py_run_script_in_dir,
+    py_run_script_with_dependencies,
+)
+from python_mcp_server.smart_async import wait_for_job
+
+server = sys.modules["python_mcp_server"]
+
+# On fastmcp 2.x @mcp.tool returns a FunctionTool; test the functions behind the tools
+py_get_concurrency_status, py_run_script_in_dir, py_run_script_with_dependencies = (
+    getattr(tool, "fn", tool)
+    for tool in (
+        py_get_concurrency_status,
+        py_run_script_in_dir,
+        py_run_script_with_dependencies,
+    )
+)
+
+
+def _make_wheel(directory: Path) -> Path:
+    """Build a one-module wheel so a dependency resolves without network access."""
+    wheel = directory / "header_probe-0.1-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w") as zf:
+        zf.writestr("header_probe.py", 'VALUE = "from-header"\n')
+        info = "header_probe-0.1.dist-info"
+        zf.writestr(
+            f"{info}/METADATA",
+            "Metadata-Version: 2.1\nName: header-probe\nVersion: 0.1\n",
+        )
+        zf.writestr(
+            f"{info}/WHEEL",
+            "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+        )
+        zf.writestr(f"{info}/RECORD", "")
+    return wheel
+
+
+def _header_script(wheel: Path) -> str:
+    """A script that imports a module only its PEP 723 header provides."""
+    return (
+        "# /// script\n"
+        f'# dependencies = ["header-probe @ {wheel.as_uri()}"]\n'
+        "# ///\n"
+        "import header_probe\n"
+        "print(header_probe.VALUE)\n"
+    )
+
+
+def test_pep723_header_dependencies():
+    """Test that dependencies declared in a PEP 723 header are installed."""
+    print("=" * 60)
+    print("TEST 1: PEP 723 header dependencies")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = _header_script(_make_wheel(Path(tmp)))
+        result = asyncio.run(
+            py_run_script_with_dependencies(
+                script_content=script,
+                python_version="3.13",
+                auto_parse_imports=False,
+            )
+        )
+        print(f"Strategy: {result['execution_strategy']}")
+        print(f"Output: {result['stdout']!r}")
+        assert result["execution_strategy"] == "uv-run"
+        assert result["exit_code"] == 0, result["stderr"]
+        assert result["stdout"].strip() == "from-header"
+
+    print("✅ PASSED: PEP 723 header dependencies are installed\n")
+
+
+def test_pep723_header_dependencies_sync():
+    """Test that the blocking runner also installs PEP 723 header dependencies."""
+    print("=" * 60)
+    print("TEST 2: PEP 723 header dependencies (blocking runner)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script_path = Path(tmp) / "header_script.py"
+        script_path.write_text(_header_script(_make_wheel(Path(tmp))))
+        # Run outside this repo's project so the cached-interpreter path applies
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            result = _exec_with_dependencies_sync(
+                script_content=None,
+                script_path=script_path,
+                python_version="3.13",
+                dependencies=[],
+                args=None,
+                timeout_seconds=300,
+            )
+        finally:
+            os.chdir(cwd)
+        print(f"Strategy: {result.execution_strategy}")
+        print(f"Output: {result.stdout!r}")
+        assert result.execution_strategy == "uv-run"
+        assert result.exit_code == 0, result.stderr
+        assert result.stdout.strip() == "from-header"
+
+    print("✅ PASSED: PEP 723 header dependencies are installed (blocking runner)\n")
+
+
+def test_env_cache_hit_rebuild_and_eviction():
+    """Test reuse, rebuild after deletion and LRU eviction of cached venvs."""
+    print("=" * 60)
+    print("TEST 3: Dependency venv cache")
+    print("=" * 60)
+
+    builds = []
+
+    def fake_build(key, env_dir, python_version, dependencies, deadline=None):
+        # Stands in for 'uv venv' + 'uv pip install'; only the marker matters here
+        builds.append(dependencies[0])
+        if dependencies[0] == "broken":
+            return False
+        env_dir.mkdir(parents=True, exist_ok=True)
+        (env_dir / server.ENV_READY_MARKER).touch()
+        return True
+
+    def env_dir(dep):
+        return server.ENV_CACHE_DIR / server._env_cache_key("3.13", [dep])
+
+    saved = (
+        server.ENV_CACHE_DIR,
+        server.ENV_CACHE_MAX_ENTRIES,
+        server._build_dep_env,
+        dict(server._ENV_CACHE),
+        dict(server._ENV_CACHE_FAILED),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        server.ENV_CACHE_DIR = Path(tmp)
+        server.ENV_CACHE_MAX_ENTRIES = 2
+        server._build_dep_env = fake_build
+        server._ENV_CACHE.clear()
+        server._ENV_CACHE_FAILED.clear()
+        try:
+            # Left behind by another server process: unknown to _ENV_CACHE
+            fake_build(None, env_dir("stale"), "3.13", ["stale"])
+            os.utime(env_dir("stale") / server.ENV_READY_MARKER, (1, 1))
+
+            interp = server._ensure_dep_env("3.13", ["a"])
+            assert interp == server._venv_python(env_dir("a"))
+            assert server._ensure_dep_env("3.13", ["a"]) == interp
+            assert builds == ["stale", "a"], builds
+            print("Second use of a venv is a cache hit")
+
+            shutil.rmtree(env_dir("a"))
+            assert server._ensure_dep_env("3.13", ["a"]) == interp
+            assert builds == ["stale", "a", "a"], builds
+            assert (env_dir("a") / server.ENV_READY_MARKER).exists()
+            print("A deleted venv is rebuilt")
+
+            os.utime(env_dir("a") / server.ENV_READY_MARKER, (2, 2))
+            server._ensure_dep_env("3.13", ["b"])
+            assert not env_dir("stale").exists()
+            assert not env_dir("stale").with_suffix(".lock").exists()
+            assert env_dir("a").exists() and env_dir("b").exists()
+            print("The least recently used venv on disk is evicted")
+
+            # Using 'a' makes 'b' the least recently used one
+            os.utime(env_dir("b") / server.ENV_READY_MARKER, (3, 3))
+            server._ensure_dep_env("3.13", ["a"])
+            server._ensure_dep_env("3.13", ["c"])
+            assert not env_dir("b").exists()
+            assert env_dir("a").exists() and env_dir("c").exists()
+            assert server._env_cache_key("3.13", ["b"]) not in server._ENV_CACHE
+            assert builds == ["stale", "a", "a", "b", "c"], builds
+            print("A used venv is kept over an older one")
+
+            assert server._ensure_dep_env("3.13", ["broken"]) is None
+            assert server._ensure_dep_env("3.13", ["broken"]) is None
+            assert builds.count("broken") == 1, builds
+            key = server._env_cache_key("3.13", ["broken"])
+            server._ENV_CACHE_FAILED[key] -= server.ENV_BUILD_RETRY_SECONDS
+            assert server._ensure_dep_env("3.13", ["broken"]) is None
+            assert builds.count("broken") == 2, builds
+            print("A failed build is retried only after the backoff")
+
+            # The real build stops once the caller's timeout has run out
+            real_build = saved[2]
+            assert not real_build(
+                "late", env_dir("late"), "3.13", ["late"], deadline=time.monotonic()
+            )
+            assert not env_dir("late").exists()
+            print("A build does not outlive the caller's deadline")
+        finally:
+            (
+                server.ENV_CACHE_DIR,
+                server.ENV_CACHE_MAX_ENTRIES,
+                server._build_dep_env,
+                cached,
+                failed,
+            ) = saved
+            server._ENV_CACHE.clear()
+            server._ENV_CACHE.update(cached)
+            server._ENV_CACHE_FAILED.clear()
+            server._ENV_CACHE_FAILED.update(failed)
+
+    print("✅ PASSED: Dependency venv cache works\n")
+
+
+def test_concurrency_limit():
+    """Test that runs beyond MAX_CONCURRENT_RUNS are rejected and slots are released."""
+    print("=" * 60)
+    print("TEST 4: Concurrent run limit")
+    print("=" * 60)
+
+    def run(code, **kwargs):
+        return py_run_script_with_dependencies(
+            script_content=code,
+            python_version="3.13",
+            auto_parse_imports=False,
+            **kwargs,
+        )
+
+    def active_runs():
+        return py_get_concurrency_status()["active_runs"]
+
+    async def scenario():
+        # Releases its slot when it raises...
+        try:
+            await run(None, script_path=Path("/nonexistent/script.py"))
+        except FileNotFoundError:
+            pass
+        else:
+            raise AssertionError("missing script did not raise")
+        assert active_runs() == 0
+        print("Slot released after an error")
+
+        # ...and when the script times out
+        result = await run("import time; time.sleep(30)", timeout_seconds=1)
+        assert result["stderr"] == "[TIMEOUT]"
+        assert active_runs() == 0
+        print("Slot released after a timeout")
+
+        # A run moved to the background keeps its slot until it finishes
+        budget = os.environ.get("SMART_ASYNC_TIMEOUT_SECONDS")
+        os.environ["SMART_ASYNC_TIMEOUT_SECONDS"] = "0.5"
+        try:
+            job = await run("import time; time.sleep(2); print('late')")
+        finally:
+            if budget is None:
+                del os.environ["SMART_ASYNC_TIMEOUT_SECONDS"]
+            else:
+                os.environ["SMART_ASYNC_TIMEOUT_SECONDS"] = budget
+        assert job["status"] == "running", job
+        status = py_get_concurrency_status()
+        print(f"Status with a background job: {status}")
+        assert status == {"max_concurrent_runs": 1, "active_runs": 1, "available": 0}
+
+        try:
+            await run("print('rejected')")
+        except RuntimeError as e:
+            print(f"Rejected: {e}")
+            assert "Too many concurrent runs (1)" in str(e)
+        else:
+            raise AssertionError("run beyond the limit was not rejected")
+
+        finished = await wait_for_job(job["job_id"], timeout=30)
+        assert finished["job"]["status"] == "completed", finished
+        assert active_runs() == 0
+        result = await run("print('accepted')")
+        assert result["stdout"] == "accepted\n"
+        print("Slot released when the background job finished")
+
+    saved = server.MAX_CONCURRENT_RUNS
+    server.MAX_CONCURRENT_RUNS = 1
+    try:
+        asyncio.run(scenario())
+    finally:
+        server.MAX_CONCURRENT_RUNS = saved
+
+    print("✅ PASSED: Concurrent run limit works\n")
+
+
+# Alternates between the streams, flushing so the merged order is deterministic
+_INTERLEAVED = (
+    "import sys\n"
+    "print('out 1', flush=True)\n"
+    "print('err 1', file=sys.stderr, flush=True)\n"
+    "print('out 2', flush=True)\n"
+)
+
+
+def test_combine_streams():
+    """Test that combine_streams returns both streams interleaved in stdout."""
+    print("=" * 60)
+    print("TEST 5: combine_streams")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        in_dir = asyncio.run(
+            py_run_script_in_dir(
+                directory=Path(tmp),
+                script_content=_INTERLEAVED,
+                python_version="3.13",
+                combine_streams=True,
+            )
+        )
+    with_deps = asyncio.run(
+        py_run_script_with_dependencies(
+            script_content=_INTERLEAVED,
+            python_version="3.13",
+            auto_parse_imports=False,
+            combine_streams=True,
+        )
+    )
+    for name, result in (("in_dir", in_dir), ("with_dependencies", with_deps)):
+        print(f"{name}: stdout={result['stdout']!r} stderr={result['stderr']!r}")
+        assert result["stdout"] == "out 1\nerr 1\nout 2\n"
+        assert result["stderr"] == ""
+        assert result["exit_code"] == 0
+
+    print("✅ PASSED: combine_streams interleaves stderr into stdout\n")
+
+
+def test_capture_output_disabled():
+    """Test that capture_output=False reports only the exit code."""
+    print("=" * 60)
+    print("TEST 6: capture_output=False")
+    print("=" * 60)
+
+    def run(directory, code, **kwargs):
+        return asyncio.run(
+            py_run_script_in_dir(
+                directory=directory,
+                script_content=code,
+                python_version="3.13",
+                capture_output=False,
+                **kwargs,
+            )
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result = run(Path(tmp), _INTERLEAVED + "sys.exit(4)\n")
+        print(f"Exit: {result['exit_code']} stdout={result['stdout']!r}")
+        assert result["exit_code"] == 4
+        assert result["stdout"] == "" and result["stderr"] == ""
+
+        result = run(Path(tmp), "import time; time.sleep(30)", timeout_seconds=1)
+        print(f"Timeout: {result['exit_code']} stderr={result['stderr']!r}")
+        assert result["stderr"] == "[TIMEOUT]"
+        assert result["stdout"] == ""
+        assert result["exit_code"] != 0
+        assert result["elapsed_seconds"] < 10
+
+    print("✅ PASSED: capture_output=False keeps exit code and timeout\n")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "=" * 60)
+    print("SCRIPT RUNNER TESTS")
+    print("=" * 60 + "\n")
+
+    try:
+        test_pep723_header_dependencies()
+        test_pep723_header_dependencies_sync()
+        test_env_cache_hit_rebuild_and_eviction()
+        test_concurrency_limit()
+        test_combine_streams()
+        test_capture_output_disabled()
+
+        print("=" * 60)
+        print("ALL TESTS PASSED ✅")
+        print("=" * 60)
+        return 0
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
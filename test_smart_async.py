@@ -15,19 +15,21 @@ This test suite validates:
 import asyncio
 import sys
 from pathlib import Path
+from time import perf_counter
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from python_mcp_server.smart_async import (
-    STATE,
     cancel_job,
     create_progress_callback,
     get_job_status,
+    get_jobs_status,
     initialize_state,
     list_jobs,
     prune_jobs,
     smart_async,
+    wait_for_job,
 )
 
 
@@ -88,9 +90,9 @@ async def test_fast_sync_completion():
     print("TEST 1: Fast Synchronous Completion")
     print("=" * 70)
 
-    start = asyncio.get_event_loop().time()
+    start = perf_counter()
     result = await fast_tool(duration=0.5)
-    elapsed = asyncio.get_event_loop().time() - start
+    elapsed = perf_counter() - start
 
     print(f"Result: {result}")
     print(f"Elapsed: {elapsed:.2f}s")
@@ -109,9 +111,9 @@ async def test_slow_timeout_switching():
     print("TEST 2: Timeout Switching to Background")
     print("=" * 70)
 
-    start = asyncio.get_event_loop().time()
+    start = perf_counter()
     result = await slow_tool(duration=5.0)
-    elapsed = asyncio.get_event_loop().time() - start
+    elapsed = perf_counter() - start
 
     print(f"Result: {result}")
     print(f"Elapsed: {elapsed:.2f}s")
@@ -123,15 +125,10 @@ async def test_slow_timeout_switching():
 
     # Wait for job to complete
     job_id = result["job_id"]
-    for _ in range(10):
-        await asyncio.sleep(1)
-        status = get_job_status(job_id)
-        print(f"  Job status: {status['job']['status']}")
-        if status["job"]["status"] == "completed":
-            break
+    final_status = await wait_for_job(job_id, timeout=10)
+    print(f"  Job status: {final_status['job']['status']}")
 
     # Verify job completed
-    final_status = get_job_status(job_id)
     assert final_status["job"]["status"] == "completed"
     assert final_status["job"]["result"]["duration"] == 5.0
 
@@ -144,11 +141,11 @@ async def test_explicit_async_mode():
     print("TEST 3: Explicit Async Mode")
     print("=" * 70)
 
-    start = asyncio.get_event_loop().time()
+    start = perf_counter()
     result = await fast_tool(
         duration=0.5, async_mode=True, job_label="Explicit async test"
     )
-    elapsed = asyncio.get_event_loop().time() - start
+    elapsed = perf_counter() - start
 
     print(f"Result: {result}")
     print(f"Elapsed: {elapsed:.2f}s")
@@ -160,9 +157,7 @@ async def test_explicit_async_mode():
 
     # Wait for completion
     job_id = result["job_id"]
-    await asyncio.sleep(1)
-
-    status = get_job_status(job_id)
+    status = await wait_for_job(job_id, timeout=5)
     assert status["job"]["status"] == "completed"
     assert status["job"]["label"] == "Explicit async test"
 
@@ -184,7 +179,7 @@ async def test_progress_tracking():
     progress_seen = False
     for i in range(20):
         await asyncio.sleep(0.2)
-        status = get_job_status(job_id)
+        status = get_jobs_status([job_id])["jobs"][job_id]
 
         if status["job"]["progress"]:
             progress = status["job"]["progress"]
@@ -201,6 +196,9 @@ async def test_progress_tracking():
     final_status = get_job_status(job_id)
     assert final_status["job"]["status"] == "completed"
     assert final_status["job"]["result"]["items"] == 10
+    assert final_status["job"]["progress"]["current"] == 10
+    # The batch lookup reports each job exactly like get_job_status
+    assert get_jobs_status([job_id])["jobs"][job_id] == final_status
 
     print("✅ PASSED: Progress tracking works\n")
 
@@ -244,7 +242,9 @@ async def test_job_listing():
     job2 = await fast_tool(duration=0.1, async_mode=True, job_label="List test 2")
     job3 = await fast_tool(duration=0.1, async_mode=True, job_label="List test 3")
 
-    await asyncio.sleep(0.3)  # Let them complete
+    # Let them complete
+    for job in (job1, job2, job3):
+        await wait_for_job(job["job_id"], timeout=5)
 
     # List all jobs
     all_jobs = list_jobs()
@@ -275,9 +275,7 @@ async def test_error_handling():
     print(f"Job launched: {job_id}")
 
     # Wait for failure
-    await asyncio.sleep(0.5)
-
-    status = get_job_status(job_id)
+    status = await wait_for_job(job_id, timeout=5)
     print(f"Job status: {status['job']['status']}")
     print(f"Error: {status['job']['error']}")
 